@@ -4,12 +4,16 @@ Process multiple audio/video files in sequence
 """
 
 import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Dict, Iterator, Tuple
 from enum import Enum
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QRunnable, QThreadPool
 
 from transcriber import Transcriber, TranscriptionResult
+from utils import available_cpu_count, detect_gpu, get_audio_duration, throttle_progress
 
 
 # ============================================================================
@@ -25,7 +29,7 @@ class BatchStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchItem:
     """A single item in the batch queue."""
     filepath: str
@@ -34,10 +38,16 @@ class BatchItem:
     message: str = ""
     result: Optional[TranscriptionResult] = None
     error: Optional[str] = None
+    duration: Optional[float] = None  # Seconds, probed when a batch starts
+    _filename: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # filepath never changes once queued, so compute the display name once
+        self._filename = os.path.basename(self.filepath)
     
     @property
     def filename(self) -> str:
-        return os.path.basename(self.filepath)
+        return self._filename
     
     @property
     def is_complete(self) -> bool:
@@ -48,8 +58,43 @@ class BatchItem:
 # BATCH WORKER
 # ============================================================================
 
+def _assign_status(item: BatchItem, status: BatchStatus):
+    """Default status setter for workers used without a BatchProcessor."""
+    item.status = status
+
+
+class _BatchItemRunnable(QRunnable):
+    """Transcribes a single batch item on a QThreadPool thread."""
+    
+    def __init__(self, index: int, item: BatchItem, worker: 'BatchWorker'):
+        super().__init__()
+        self.index = index
+        self.item = item
+        self.worker = worker
+    
+    def run(self):
+        self.worker._process_item(self.index, self.item)
+
+
 class BatchWorker(QThread):
-    """Worker thread for processing batch items."""
+    """
+    Worker thread for processing batch items.
+    
+    Items are transcribed concurrently on a QThreadPool sized so that
+    pool threads × whisper threads roughly matches the CPU count. Each
+    pool thread loads the model once and reuses it for every item it
+    picks up. On a GPU the pool has a single thread, so only one copy of
+    the model is loaded. This thread only waits for the pool and reports
+    when the batch is done.
+    
+    Threads rather than processes are deliberate: whisper.cpp releases the
+    GIL for the whole inference call, so pool threads already run in
+    parallel, and results can be handed to signals without pickling.
+    
+    With more than one pool thread, items are started longest first, so
+    a long file queued last doesn't keep one thread busy while the rest
+    sit idle.
+    """
     
     # Signals
     item_started = pyqtSignal(int)           # index
@@ -67,6 +112,8 @@ class BatchWorker(QThread):
         n_threads: int = 4,
         enable_diarization: bool = False,
         num_speakers: Optional[int] = None,
+        set_status: Optional[Callable[[BatchItem, BatchStatus], None]] = None,
+        gpu: Optional[Tuple[str, str]] = None,
         parent: Optional[QObject] = None
     ):
         super().__init__(parent)
@@ -77,90 +124,135 @@ class BatchWorker(QThread):
         self.n_threads = n_threads
         self.enable_diarization = enable_diarization
         self.num_speakers = num_speakers
-        self._cancelled = False
-        self._transcriber = Transcriber()
-        self._current_index = -1
+        self._set_status = set_status or _assign_status
+        self.gpu = gpu  # (gpu_type, description); detected in run() when None
+        self._cancelled = threading.Event()
+        # Per-pool-thread Transcriber, keyed by thread id: Qt pool threads
+        # get a fresh Python thread state per runnable, so threading.local
+        # values don't survive from one item to the next
+        self._transcribers: Dict[int, Transcriber] = {}
+        self._pool = QThreadPool()
     
     def cancel(self):
         """Cancel the batch processing."""
-        self._cancelled = True
-        self._transcriber.cancel()
+        self._cancelled.set()
     
     def run(self):
-        """Process all items in sequence."""
-        for i, item in enumerate(self.items):
-            if self._cancelled:
-                item.status = BatchStatus.CANCELLED
-                continue
-            
-            if item.status != BatchStatus.PENDING:
-                continue
-            
-            self._current_index = i
-            self._process_item(i, item)
+        """Process all pending items on the thread pool."""
+        # Detected once here, not by every pool thread's Transcriber
+        if self.gpu is None:
+            self.gpu = detect_gpu()
+        if self.gpu[0] != 'cpu':
+            self._pool.setMaxThreadCount(1)
+        else:
+            self._pool.setMaxThreadCount(max(1, available_cpu_count() // max(1, self.n_threads)))
         
+        pending = [
+            (i, item) for i, item in enumerate(self.items)
+            if item.status == BatchStatus.PENDING
+        ]
+        
+        if self._pool.maxThreadCount() > 1 and len(pending) > 1:
+            self._probe_durations([item for _, item in pending])
+            # Unknown durations go first, as they may well be long
+            pending.sort(
+                key=lambda entry: entry[1].duration if entry[1].duration is not None else float('inf'),
+                reverse=True
+            )
+        
+        for i, item in pending:
+            self._pool.start(_BatchItemRunnable(i, item, self))
+        
+        self._pool.waitForDone()
         self.batch_finished.emit()
     
+    def _probe_durations(self, items: List[BatchItem]):
+        """Fill in item.duration where it is not known yet."""
+        unknown = [item for item in items if item.duration is None]
+        if not unknown:
+            return
+        
+        # ffprobe calls are mostly process startup, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(unknown))) as executor:
+            durations = executor.map(lambda item: get_audio_duration(item.filepath), unknown)
+            for item, duration in zip(unknown, durations):
+                item.duration = duration
+    
+    def _thread_transcriber(self) -> Transcriber:
+        """Get the calling pool thread's Transcriber, loading the model on first use."""
+        thread_id = threading.get_ident()
+        transcriber = self._transcribers.get(thread_id)
+        if transcriber is None:
+            transcriber = Transcriber(gpu=self.gpu)
+            transcriber.load_model(self.model_name, self.n_threads)
+            self._transcribers[thread_id] = transcriber
+        return transcriber
+    
     def _process_item(self, index: int, item: BatchItem):
-        """Process a single batch item."""
-        item.status = BatchStatus.PROCESSING
+        """Process a single batch item (runs on a pool thread)."""
+        if self._cancelled.is_set():
+            self._set_status(item, BatchStatus.CANCELLED)
+            return
+        
+        self._set_status(item, BatchStatus.PROCESSING)
         self.item_started.emit(index)
         
-        # Create synchronous processing using events
-        import threading
-        finished_event = threading.Event()
-        error_holder = [None]
-        result_holder = [None]
+        emit_progress = throttle_progress(
+            lambda pct, msg: self.item_progress.emit(index, pct, msg)
+        )
         
         def on_progress(pct, msg):
             item.progress = pct
             item.message = msg
-            self.item_progress.emit(index, pct, msg)
-        
-        def on_finished(result):
-            result_holder[0] = result
-            finished_event.set()
-        
-        def on_error(error):
-            error_holder[0] = error
-            finished_event.set()
-        
-        # Start transcription
-        self._transcriber.transcribe(
-            filepath=item.filepath,
-            model_name=self.model_name,
-            language=self.language,
-            translate=self.translate,
-            n_threads=self.n_threads,
-            enable_diarization=self.enable_diarization,
-            num_speakers=self.num_speakers,
-            on_progress=on_progress,
-            on_finished=on_finished,
-            on_error=on_error
-        )
+            emit_progress(pct, msg)
         
-        # Wait for completion
-        finished_event.wait()
+        try:
+            result = self._thread_transcriber().transcribe_loaded(
+                filepath=item.filepath,
+                language=self.language,
+                translate=self.translate,
+                enable_diarization=self.enable_diarization,
+                num_speakers=self.num_speakers,
+                on_progress=on_progress,
+                cancel_event=self._cancelled
+            )
+        except Exception as e:
+            # An aborted decode raises; report the cancel, not an error
+            if self._cancelled.is_set():
+                self._set_status(item, BatchStatus.CANCELLED)
+                return
+            item.error = str(e)
+            self._set_status(item, BatchStatus.ERROR)
+            self.item_error.emit(index, item.error)
+            return
         
-        if self._cancelled:
-            item.status = BatchStatus.CANCELLED
+        if self._cancelled.is_set() or result is None:
+            self._set_status(item, BatchStatus.CANCELLED)
             return
         
-        if error_holder[0]:
-            item.status = BatchStatus.ERROR
-            item.error = error_holder[0]
-            self.item_error.emit(index, error_holder[0])
-        else:
-            item.status = BatchStatus.COMPLETE
-            item.result = result_holder[0]
-            item.progress = 100
-            self.item_finished.emit(index, result_holder[0])
+        item.result = result
+        item.progress = 100
+        self._set_status(item, BatchStatus.COMPLETE)
+        self.item_finished.emit(index, result)
 
 
 # ============================================================================
 # BATCH PROCESSOR
 # ============================================================================
 
+def _safe_export(
+    export_func: Callable[[TranscriptionResult, str], None],
+    result: TranscriptionResult,
+    output_path: str
+) -> bool:
+    """Export a single result, returning False instead of raising on failure."""
+    try:
+        export_func(result, output_path)
+        return True
+    except Exception:
+        return False
+
+
 class BatchProcessor(QObject):
     """
     Manage batch processing of multiple audio/video files.
@@ -181,12 +273,30 @@ class BatchProcessor(QObject):
     def __init__(self, parent: Optional[QObject] = None):
         super().__init__(parent)
         self._items: List[BatchItem] = []
+        self._by_path: Dict[str, BatchItem] = {}
+        self._status_counts: Dict[BatchStatus, int] = {s: 0 for s in BatchStatus}
+        self._status_lock = threading.Lock()
         self._worker: Optional[BatchWorker] = None
     
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __getitem__(self, index: int) -> BatchItem:
+        return self._items[index]
+    
+    def __iter__(self) -> Iterator[BatchItem]:
+        return iter(self._items)
+    
     @property
-    def items(self) -> List[BatchItem]:
-        """Get all batch items."""
-        return self._items.copy()
+    def items(self) -> Tuple[BatchItem, ...]:
+        """
+        Get a read-only snapshot of all batch items.
+        
+        Deprecated: index or iterate the processor directly
+        (processor[i], len(processor), for item in processor),
+        which avoids copying the queue.
+        """
+        return tuple(self._items)
     
     @property
     def count(self) -> int:
@@ -196,49 +306,74 @@ class BatchProcessor(QObject):
     @property
     def pending_count(self) -> int:
         """Get number of pending items."""
-        return sum(1 for item in self._items if item.status == BatchStatus.PENDING)
+        return self._status_counts[BatchStatus.PENDING]
     
     @property
     def complete_count(self) -> int:
         """Get number of completed items."""
-        return sum(1 for item in self._items if item.status == BatchStatus.COMPLETE)
+        return self._status_counts[BatchStatus.COMPLETE]
     
     @property
     def is_processing(self) -> bool:
         """Check if batch is currently processing."""
         return self._worker is not None and self._worker.isRunning()
     
+    def _set_status(self, item: BatchItem, status: BatchStatus):
+        """Change an item's status, keeping the per-status counters in sync."""
+        with self._status_lock:
+            self._status_counts[item.status] -= 1
+            self._status_counts[status] += 1
+            item.status = status
+    
+    def _track(self, item: BatchItem):
+        """Register a newly queued item in the lookup tables."""
+        self._by_path[item.filepath] = item
+        with self._status_lock:
+            self._status_counts[item.status] += 1
+    
+    def _untrack(self, item: BatchItem):
+        """Drop a removed item from the lookup tables."""
+        self._by_path.pop(item.filepath, None)
+        with self._status_lock:
+            self._status_counts[item.status] -= 1
+    
     def add_file(self, filepath: str) -> bool:
         """Add a file to the batch queue."""
-        if not os.path.isfile(filepath):
-            return False
-        
-        # Check for duplicates
-        for item in self._items:
-            if item.filepath == filepath:
-                return False
-        
-        self._items.append(BatchItem(filepath=filepath))
-        return True
+        return self.add_files([filepath]) == 1
     
     def add_files(self, filepaths: List[str]) -> int:
         """Add multiple files. Returns count of successfully added files."""
-        count = 0
-        for path in filepaths:
-            if self.add_file(path):
-                count += 1
-        return count
+        # Drop duplicates (within the input and against the queue) before
+        # touching the filesystem, keeping the caller's order
+        candidates = [
+            path for path in dict.fromkeys(filepaths)
+            if path not in self._by_path
+        ]
+        
+        new_items = []
+        for path in candidates:
+            try:
+                if stat.S_ISREG(os.stat(path).st_mode):
+                    new_items.append(BatchItem(filepath=path))
+            except (OSError, ValueError):
+                continue
+        
+        self._items.extend(new_items)
+        for item in new_items:
+            self._track(item)
+        return len(new_items)
     
     def remove_item(self, index: int) -> bool:
-        """Remove an item from the queue (only if not processing)."""
-        if index < 0 or index >= len(self._items):
+        """Remove an item from the queue (not while a batch is running)."""
+        # Every pending item is already queued on the worker's pool, and
+        # its signals carry row indices, so the queue is frozen until the
+        # batch finishes
+        if self.is_processing:
             return False
-        
-        item = self._items[index]
-        if item.status == BatchStatus.PROCESSING:
+        if index < 0 or index >= len(self._items):
             return False
         
-        self._items.pop(index)
+        self._untrack(self._items.pop(index))
         return True
     
     def clear(self):
@@ -246,9 +381,15 @@ class BatchProcessor(QObject):
         if self.is_processing:
             self.cancel()
         self._items.clear()
+        self._by_path.clear()
+        with self._status_lock:
+            self._status_counts = {s: 0 for s in BatchStatus}
     
     def clear_completed(self):
         """Remove completed and errored items."""
+        for item in self._items:
+            if item.is_complete:
+                self._untrack(item)
         self._items = [item for item in self._items if not item.is_complete]
     
     def start(
@@ -258,9 +399,15 @@ class BatchProcessor(QObject):
         translate: bool = False,
         n_threads: int = 4,
         enable_diarization: bool = False,
-        num_speakers: Optional[int] = None
+        num_speakers: Optional[int] = None,
+        gpu: Optional[Tuple[str, str]] = None
     ):
-        """Start processing the batch queue."""
+        """
+        Start processing the batch queue.
+        
+        gpu is the (gpu_type, description) to run on, as returned by
+        detect_gpu() (('cpu', ...) forces the CPU); detected when None.
+        """
         if self.is_processing:
             return
         
@@ -270,7 +417,7 @@ class BatchProcessor(QObject):
         # Reset pending items
         for item in self._items:
             if item.status in (BatchStatus.ERROR, BatchStatus.CANCELLED):
-                item.status = BatchStatus.PENDING
+                self._set_status(item, BatchStatus.PENDING)
                 item.progress = 0
                 item.error = None
         
@@ -282,7 +429,9 @@ class BatchProcessor(QObject):
             translate=translate,
             n_threads=n_threads,
             enable_diarization=enable_diarization,
-            num_speakers=num_speakers
+            num_speakers=num_speakers,
+            set_status=self._set_status,
+            gpu=gpu
         )
         
         # Connect signals
@@ -325,27 +474,35 @@ class BatchProcessor(QObject):
         Returns:
             List of created file paths
         """
-        from exporters import export_result
+        from exporters import EXPORT_FORMATS
+        
+        if format_key not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown format: {format_key}")
+        
+        # Resolved once for the whole batch
+        _, export_func = EXPORT_FORMATS[format_key]
+        ext = 'txt' if format_key in ('txt', 'txt_ts') else format_key
         
         os.makedirs(output_dir, exist_ok=True)
-        created_files = []
         
+        tasks = []
         for item in self._items:
             if item.status != BatchStatus.COMPLETE or not item.result:
                 continue
             
             # Generate output filename
             base_name = os.path.splitext(item.filename)[0]
-            ext = 'txt' if format_key in ('txt', 'txt_ts') else format_key
             output_path = os.path.join(output_dir, f"{base_name}.{ext}")
-            
-            try:
-                export_result(item.result, output_path, format_key)
-                created_files.append(output_path)
-            except Exception:
-                pass
+            tasks.append((item.result, output_path))
+        
+        if not tasks:
+            return []
         
-        return created_files
+        # Exports are I/O-bound, so threads overlap the disk writes
+        # (map() preserves task order)
+        with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+            results = executor.map(lambda task: _safe_export(export_func, *task), tasks)
+            return [path for (_, path), ok in zip(tasks, results) if ok]
 
 
 # ============================================================================
@@ -5,17 +5,23 @@ Store and load user settings
 
 import os
 import json
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+import tempfile
+from dataclasses import dataclass, field, fields
+from typing import ClassVar, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
 
 # Config directory
 CONFIG_DIR = Path.home() / ".whisper-fedora"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """User configuration settings."""
     
@@ -30,6 +36,21 @@ class Config:
     batch_output_dir: str = ""
     batch_auto_export: bool = True
     
+    # Transcription settings
+    # "auto": faster-whisper on CUDA or CPU when installed, whisper.cpp
+    # otherwise (and on ROCm/Metal); "whispercpp": always whisper.cpp;
+    # "openvino": int8 OpenVINO model on the CPU (needs optimum-intel)
+    backend: str = "auto"
+    # "auto": float16 on CUDA, int8 on CPU with faster-whisper, and a
+    # downloaded quantized ggml variant of the selected model on
+    # whisper.cpp; "full": exactly the selected model in float32
+    precision: str = "auto"
+    # ggml quantization written by "Convert" (whisper.cpp quantize types)
+    model_quant: str = "q5_k"
+    # Cut silence out before decoding (silero-vad for whisper.cpp; built into
+    # faster-whisper)
+    vad_filter: bool = True
+    
     # LM Studio settings
     lm_studio_url: str = "http://localhost:1234/v1"
     
@@ -37,14 +58,45 @@ class Config:
     show_timestamps: bool = True
     show_speaker_labels: bool = True
     
+    # Init field names, filled in once below the class
+    _KNOWN_FIELDS: ClassVar[frozenset] = frozenset()
+    
+    # ((mtime_ns, size), filtered settings) from the last parse in load()
+    _load_cache: ClassVar[Optional[Tuple[Tuple[int, int], dict]]] = None
+    
+    # Bytes written by the last successful save() (not persisted)
+    _last_serialized: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> dict:
+        """Get the persisted settings as a plain dict."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+    
     def save(self) -> bool:
-        """Save configuration to file."""
+        """Save configuration to file (skipped if nothing changed)."""
         try:
+            data = self.to_dict()
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            
+            if payload == self._last_serialized and CONFIG_FILE.exists():
+                return True
+            
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self), f, indent=2)
+            # Write to a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated config behind
+            fd, temp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix='.config-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(temp_path, CONFIG_FILE)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
             
+            self._last_serialized = payload
             return True
         except Exception as e:
             print(f"Failed to save config: {e}")
@@ -52,19 +104,31 @@ class Config:
     
     @classmethod
     def load(cls) -> 'Config':
-        """Load configuration from file."""
-        if not CONFIG_FILE.exists():
+        """Load configuration from file (re-parsed only if it changed)."""
+        try:
+            st = CONFIG_FILE.stat()
+        except FileNotFoundError:
+            return cls()
+        except OSError as e:
+            print(f"Failed to load config: {e}")
             return cls()
         
+        key = (st.st_mtime_ns, st.st_size)
+        cached = Config._load_cache
+        if cached is not None and cached[0] == key:
+            return cls(**cached[1])
+        
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Only use known fields
-            known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-            filtered_data = {k: v for k, v in data.items() if k in known_fields}
+            filtered_data = {k: v for k, v in data.items() if k in cls._KNOWN_FIELDS}
             
-            return cls(**filtered_data)
+            config = cls(**filtered_data)
+            Config._load_cache = (key, filtered_data)
+            return config
         except Exception as e:
             print(f"Failed to load config: {e}")
             return cls()
@@ -74,6 +138,9 @@ class Config:
         return bool(self.hf_token and len(self.hf_token) > 10)
 
 
+Config._KNOWN_FIELDS = frozenset(f.name for f in fields(Config) if f.init)
+
+
 # Global config instance (lazy loaded)
 _config: Optional[Config] = None
 
@@ -109,7 +176,7 @@ if __name__ == "__main__":
     
     config = get_config()
     print(f"\nCurrent config:")
-    for key, value in asdict(config).items():
+    for key, value in config.to_dict().items():
         # Mask token
         if key == 'hf_token' and value:
             value = value[:8] + "..." if len(value) > 8 else "***"
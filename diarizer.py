@@ -5,8 +5,15 @@ Identify and label different speakers using pyannote-audio
 
 import os
 import warnings
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import Optional, Callable, List, Tuple
+from typing import Optional, Callable, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # Optional: falls back to per-segment bisect lookups
+    np = None
 
 # Suppress some warnings from pyannote
 warnings.filterwarnings("ignore", message=".*torchaudio.*")
@@ -18,7 +25,7 @@ from config import get_config
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SpeakerSegment:
     """A segment of audio attributed to a specific speaker."""
     start: float      # Start time in seconds
@@ -27,20 +34,80 @@ class SpeakerSegment:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DiarizationResult:
-    """Complete diarization result."""
+    """Complete diarization result (segments sorted by start time)."""
     segments: List[SpeakerSegment]
     num_speakers: int
     duration: float
+    _starts: array = field(init=False, repr=False, compare=False)
+    _max_ends: array = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Parallel arrays for binary search in get_speaker_at().
+        # _max_ends[i] is the latest end among segments[0..i], which lets
+        # overlapping turns resolve to the earliest matching segment.
+        self._starts = array('d', [seg.start for seg in self.segments])
+        self._max_ends = array('d')
+        latest = float('-inf')
+        for seg in self.segments:
+            latest = max(latest, seg.end)
+            self._max_ends.append(latest)
     
     def get_speaker_at(self, time: float) -> Optional[str]:
         """Get the speaker at a specific time."""
-        for seg in self.segments:
-            if seg.start <= time <= seg.end:
-                return seg.speaker
+        # Last segment starting at or before `time`
+        last = bisect_right(self._starts, time)
+        if last == 0:
+            return None
+        
+        # First segment (among those) still running at `time`
+        first = bisect_left(self._max_ends, time, 0, last)
+        if first < last:
+            return self.segments[first].speaker
         return None
     
+    def get_speakers_for(
+        self,
+        starts: Sequence[float],
+        ends: Sequence[float]
+    ) -> List[Optional[str]]:
+        """
+        Get the speaker for each (start, end) span in one pass.
+        
+        Looks up the speaker at each span's midpoint, falling back to its
+        start, exactly like calling get_speaker_at() twice per span.
+        """
+        if np is None or not self.segments:
+            speakers = []
+            for start, end in zip(starts, ends):
+                speaker = self.get_speaker_at((start + end) / 2)
+                if speaker is None:
+                    speaker = self.get_speaker_at(start)
+                speakers.append(speaker)
+            return speakers
+        
+        seg_starts = np.frombuffer(self._starts, dtype=np.float64)
+        max_ends = np.frombuffer(self._max_ends, dtype=np.float64)
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        
+        def first_active(times):
+            # Vectorized form of the two bisects in get_speaker_at()
+            last = np.searchsorted(seg_starts, times, side='right')
+            first = np.searchsorted(max_ends, times, side='left')
+            return np.where(first < last, first, -1)
+        
+        idx = first_active((starts + ends) / 2)
+        missing = idx < 0
+        if missing.any():
+            idx[missing] = first_active(starts[missing])
+        
+        # Index -1 lands on the trailing None
+        labels = [seg.speaker for seg in self.segments]
+        labels.append(None)
+        return [labels[i] for i in idx.tolist()]
+    
     def get_speaker_times(self) -> dict[str, float]:
         """Get total speaking time for each speaker."""
         times = {}
@@ -131,7 +198,7 @@ class Diarizer:
     
     def diarize(
         self,
-        audio_path: str,
+        audio: Union[str, "np.ndarray"],
         num_speakers: Optional[int] = None,
         min_speakers: int = 1,
         max_speakers: int = 10,
@@ -141,7 +208,8 @@ class Diarizer:
         Perform speaker diarization on an audio file.
         
         Args:
-            audio_path: Path to audio file (WAV recommended)
+            audio: Path to audio file (WAV recommended), or float32 mono
+                samples at 16 kHz already decoded in memory
             num_speakers: Exact number of speakers (None = auto-detect)
             min_speakers: Minimum speakers to detect (for auto-detect)
             max_speakers: Maximum speakers to detect (for auto-detect)
@@ -166,28 +234,35 @@ class Diarizer:
             params['min_speakers'] = min_speakers
             params['max_speakers'] = max_speakers
         
+        if not isinstance(audio, str):
+            # pyannote takes in-memory audio as a (channel, time) tensor
+            import torch
+            audio = {
+                'waveform': torch.from_numpy(audio).unsqueeze(0),
+                'sample_rate': 16000
+            }
+        
         # Run diarization
         try:
-            diarization = self._pipeline(audio_path, **params)
+            diarization = self._pipeline(audio, **params)
         except Exception as e:
             raise RuntimeError(f"Diarization failed: {e}")
         
         if on_progress:
             on_progress(80, "Processing results...")
         
-        # Convert to our format
+        # Convert to our format. pyannote's Annotation keeps its tracks in a
+        # sorted container, so itertracks() already yields turns in start
+        # order as DiarizationResult expects.
         segments = []
-        speakers_seen = set()
         speaker_map = {}  # Map pyannote labels to friendly names
         
         for turn, _, speaker in diarization.itertracks(yield_label=True):
             # Create friendly speaker name
-            if speaker not in speaker_map:
-                speaker_num = len(speaker_map) + 1
-                speaker_map[speaker] = f"Speaker {speaker_num}"
-            
-            friendly_name = speaker_map[speaker]
-            speakers_seen.add(friendly_name)
+            friendly_name = speaker_map.get(speaker)
+            if friendly_name is None:
+                friendly_name = f"Speaker {len(speaker_map) + 1}"
+                speaker_map[speaker] = friendly_name
             
             segments.append(SpeakerSegment(
                 start=turn.start,
@@ -195,18 +270,15 @@ class Diarizer:
                 speaker=friendly_name
             ))
         
-        # Sort by start time
-        segments.sort(key=lambda s: s.start)
-        
         # Get duration from last segment
         duration = segments[-1].end if segments else 0.0
         
         if on_progress:
-            on_progress(100, f"Found {len(speakers_seen)} speakers")
+            on_progress(100, f"Found {len(speaker_map)} speakers")
         
         return DiarizationResult(
             segments=segments,
-            num_speakers=len(speakers_seen),
+            num_speakers=len(speaker_map),
             duration=duration
         )
 
@@ -225,24 +297,16 @@ def merge_transcription_with_diarization(
     Returns:
         List of (start, end, text, speaker) tuples
     """
-    result = []
+    if not transcription_segments:
+        return []
     
-    for start, end, text in transcription_segments:
-        # Find the speaker at the midpoint of this segment
-        midpoint = (start + end) / 2
-        speaker = diarization.get_speaker_at(midpoint)
-        
-        # If no speaker found, try start of segment
-        if speaker is None:
-            speaker = diarization.get_speaker_at(start)
-        
-        # Default to Unknown if still not found
-        if speaker is None:
-            speaker = "Unknown"
-        
-        result.append((start, end, text, speaker))
+    starts, ends, texts = zip(*transcription_segments)
+    speakers = diarization.get_speakers_for(starts, ends)
     
-    return result
+    return [
+        (start, end, text, speaker or "Unknown")
+        for start, end, text, speaker in zip(starts, ends, texts, speakers)
+    ]
 
 
 # ============================================================================
@@ -265,7 +329,7 @@ class SimpleDiarizer:
     
     def diarize(
         self,
-        audio_path: str,
+        audio: Union[str, "np.ndarray"],
         num_speakers: Optional[int] = 2,
         on_progress: Optional[Callable[[int, str], None]] = None
     ) -> DiarizationResult:
@@ -3,9 +3,16 @@ Whisper Fedora UI - Export Functions
 Export transcription results to various formats
 """
 
+import json
+
 from transcriber import TranscriptionResult
 from utils import format_timestamp_srt, format_timestamp_vtt
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
 
 def export_txt(result: TranscriptionResult, filepath: str) -> None:
     """Export transcription as plain text."""
@@ -15,62 +22,65 @@ def export_txt(result: TranscriptionResult, filepath: str) -> None:
 
 def export_txt_with_timestamps(result: TranscriptionResult, filepath: str) -> None:
     """Export transcription as text with timestamps."""
+    content = "".join(
+        f"[{format_timestamp_vtt(seg.start)}] {seg.text.strip()}\n"
+        for seg in result.segments
+    )
     with open(filepath, 'w', encoding='utf-8') as f:
-        for seg in result.segments:
-            timestamp = format_timestamp_vtt(seg.start)
-            f.write(f"[{timestamp}] {seg.text.strip()}\n")
+        f.write(content)
+
+
+def _subtitle_cues(result: TranscriptionResult, format_timestamp) -> str:
+    """Build numbered subtitle cues as a single string."""
+    return "".join(
+        f"{i}\n{format_timestamp(seg.start)} --> {format_timestamp(seg.end)}\n"
+        f"{seg.text.strip()}\n\n"
+        for i, seg in enumerate(result.segments, start=1)
+    )
 
 
 def export_srt(result: TranscriptionResult, filepath: str) -> None:
     """Export transcription as SRT subtitle file."""
+    content = _subtitle_cues(result, format_timestamp_srt)
     with open(filepath, 'w', encoding='utf-8') as f:
-        for i, seg in enumerate(result.segments, start=1):
-            start = format_timestamp_srt(seg.start)
-            end = format_timestamp_srt(seg.end)
-            text = seg.text.strip()
-            
-            f.write(f"{i}\n")
-            f.write(f"{start} --> {end}\n")
-            f.write(f"{text}\n")
-            f.write("\n")
+        f.write(content)
 
 
 def export_vtt(result: TranscriptionResult, filepath: str) -> None:
     """Export transcription as WebVTT subtitle file."""
+    content = "WEBVTT\n\n" + _subtitle_cues(result, format_timestamp_vtt)
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write("WEBVTT\n\n")
-        
-        for i, seg in enumerate(result.segments, start=1):
-            start = format_timestamp_vtt(seg.start)
-            end = format_timestamp_vtt(seg.end)
-            text = seg.text.strip()
-            
-            f.write(f"{i}\n")
-            f.write(f"{start} --> {end}\n")
-            f.write(f"{text}\n")
-            f.write("\n")
+        f.write(content)
+
+
+def _json_bytes(value, indent: bool = False) -> bytes:
+    """Encode a value as UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(value, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
 
 
 def export_json(result: TranscriptionResult, filepath: str) -> None:
     """Export transcription as JSON."""
-    import json
-    
-    data = {
-        'language': result.language,
-        'duration': result.duration,
-        'text': result.full_text,
-        'segments': [
-            {
-                'start': seg.start,
-                'end': seg.end,
-                'text': seg.text.strip()
-            }
-            for seg in result.segments
-        ]
-    }
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Segments are encoded and written one at a time so a long transcript
+    # is never duplicated as a full list of dicts in memory. The layout
+    # matches json.dump(..., indent=2).
+    with open(filepath, 'wb') as f:
+        f.write(b'{\n  "language": ' + _json_bytes(result.language))
+        f.write(b',\n  "duration": ' + _json_bytes(result.duration))
+        f.write(b',\n  "text": ' + _json_bytes(result.full_text))
+        f.write(b',\n  "segments": [')
+        
+        sep = b'\n    '
+        for seg in result.segments:
+            encoded = _json_bytes(
+                {'start': seg.start, 'end': seg.end, 'text': seg.text.strip()},
+                indent=True
+            )
+            f.write(sep + encoded.replace(b'\n', b'\n    '))
+            sep = b',\n    '
+        
+        f.write(b'\n  ]\n}' if result.segments else b']\n}')
 
 
 # Export format options
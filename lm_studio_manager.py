@@ -3,19 +3,71 @@ Whisper Fedora - LM Studio Manager
 Control LM Studio server and models via CLI
 """
 
+import os
+import asyncio
+import http.client
 import subprocess
 import shutil
 import json
 import time
-from dataclasses import dataclass
-from typing import Optional, List
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, List, Tuple, Iterator
+
+try:
+    import ijson
+except ImportError:  # Optional: falls back to parsing the full output
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+from pathlib import Path
+
+from text_processor import http_request
+
+
+# How long probe results are trusted before checking again (seconds).
+# A refused connection is a definite "down"; a timeout is only a guess,
+# so it is re-checked much sooner.
+SERVER_STATE_TTL = 2.0
+SERVER_STATE_UNCERTAIN_TTL = 0.1
+CLI_PATH_TTL = 30.0
+
+# After this long the cached model list is still served but reported stale,
+# so models pulled outside the app eventually show up (seconds)
+MODELS_CACHE_TTL = 300.0
+
+# Last discovered lms path, reused across app launches if still executable
+CLI_PATH_CACHE_FILE = Path.home() / ".cache" / "whisper-fedora" / "lms_cli_path"
+
+
+def _json_loads(data: bytes):
+    """Parse JSON CLI output (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+_BYTES_PER_GB = 1073741824  # 1024 ** 3
+
+# Preferred quantizations, best first (Q8 > Q6 > Q5 > Q4), lowercased for
+# matching against ModelInfo.quantization
+QUANT_PREFERENCE_RANK = {
+    quant.lower(): rank
+    for rank, quant in enumerate(
+        ['Q8', 'Q6_K', 'Q5_K_M', 'Q5_K_S', 'Q4_K_M', 'Q4_K_S', '8bit', '4bit']
+    )
+}
+
+
+@dataclass(slots=True)
 class ModelInfo:
     """Information about a downloaded model."""
     path: str           # Full model path (e.g., "lmstudio-community/Meta-Llama-3.1-8B-Instruct-GGUF")
@@ -23,26 +75,61 @@ class ModelInfo:
     size_bytes: int     # Size in bytes
     quantization: str   # Quantization type (e.g., "Q4_K_M")
     architecture: str   # Model architecture (e.g., "llama")
+    _size_gb: float = field(init=False, repr=False, compare=False)
+    _display_name: str = field(init=False, repr=False, compare=False)
+    _quant_rank: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Computed once here; the model list is re-rendered often
+        self._size_gb = (self.size_bytes or 0) / _BYTES_PER_GB
+        
+        quant = str(self.quantization).lower()
+        self._quant_rank = min(
+            (rank for key, rank in QUANT_PREFERENCE_RANK.items() if key in quant),
+            default=len(QUANT_PREFERENCE_RANK)
+        )
+        
+        # Extract just the model name part
+        _, slash, last = self.path.rpartition('/')
+        if slash:
+            name = last.removesuffix('-GGUF').removesuffix('.gguf')
+        else:
+            name = self.name
+        
+        # Add quantization if available
+        if self.quantization:
+            self._display_name = f"{name} ({self.quantization})"
+        else:
+            self._display_name = name
     
     @property
     def size_gb(self) -> float:
         """Get size in gigabytes."""
-        return self.size_bytes / (1024 ** 3)
+        return self._size_gb
     
     @property
     def display_name(self) -> str:
         """Get a short display name for UI."""
-        # Extract just the model name part
-        parts = self.path.split('/')
-        if len(parts) > 1:
-            name = parts[-1].replace('-GGUF', '').replace('.gguf', '')
-        else:
-            name = self.name
-        
-        # Add quantization if available
-        if self.quantization:
-            return f"{name} ({self.quantization})"
-        return name
+        return self._display_name
+
+
+def _model_from_json(item) -> Optional[ModelInfo]:
+    """Build a ModelInfo from one `lms ls --json` entry."""
+    # Handle different possible JSON structures
+    if not isinstance(item, dict):
+        return None
+    
+    # Fallback keys are only looked up when the primary one is missing
+    get = item.get
+    path = get('path') or get('id', '')
+    
+    return ModelInfo(
+        path=path,
+        name=get('name') or path.rpartition('/')[2],
+        size_bytes=get('size') or get('sizeBytes', 0),
+        quantization=get('quantization', ''),
+        architecture=get('architecture', '')
+    )
 
 
 # ============================================================================
@@ -60,7 +147,13 @@ class LMStudioManager:
     
     def __init__(self):
         self._cli_path: Optional[str] = None
+        self._cli_path_expiry = 0.0
         self._cached_models: Optional[List[ModelInfo]] = None
+        self._models_cached_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight = False
+        self._server_running = False
+        self._server_state_expiry = 0.0
     
     # =========================================================================
     # CLI DETECTION
@@ -71,14 +164,40 @@ class LMStudioManager:
         return self._get_cli_path() is not None
     
     def _get_cli_path(self) -> Optional[str]:
-        """Get the path to the lms CLI."""
-        if self._cli_path is not None:
+        """Get the path to the lms CLI (cached for CLI_PATH_TTL seconds)."""
+        now = time.monotonic()
+        if now < self._cli_path_expiry:
             return self._cli_path
         
+        self._cli_path = self._find_cli_path()
+        self._cli_path_expiry = now + CLI_PATH_TTL
+        return self._cli_path
+    
+    @staticmethod
+    def _find_cli_path() -> Optional[str]:
+        """Find the lms CLI, trying the path saved by a previous run first."""
+        try:
+            cached = CLI_PATH_CACHE_FILE.read_text(encoding='utf-8').strip()
+        except OSError:
+            cached = ""
+        if cached and os.path.isfile(cached) and os.access(cached, os.X_OK):
+            return cached
+        
+        path = LMStudioManager._search_cli_path()
+        if path and path != cached:
+            try:
+                CLI_PATH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                CLI_PATH_CACHE_FILE.write_text(path, encoding='utf-8')
+            except OSError:
+                pass  # Cache is best-effort
+        return path
+    
+    @staticmethod
+    def _search_cli_path() -> Optional[str]:
+        """Search PATH and common install locations for the lms CLI."""
         # Check if lms is in PATH
         path = shutil.which('lms')
         if path:
-            self._cli_path = path
             return path
         
         # Check common installation locations
@@ -88,11 +207,9 @@ class LMStudioManager:
             '~/.lmstudio/bin/lms',
         ]
         
-        import os
         for p in common_paths:
             expanded = os.path.expanduser(p)
             if os.path.isfile(expanded):
-                self._cli_path = expanded
                 return expanded
         
         return None
@@ -126,24 +243,168 @@ class LMStudioManager:
         except Exception as e:
             return False, str(e)
     
+    def _run_cli_bytes(self, args: List[str], timeout: int = 30) -> Tuple[bool, bytes]:
+        """
+        Run an LM Studio CLI command and return its raw output.
+        
+        Used for --json commands, whose output goes straight to the JSON
+        parser without a text decode.
+        
+        Returns:
+            Tuple of (success, output)
+        """
+        cli_path = self._get_cli_path()
+        if not cli_path:
+            return False, b"LM Studio CLI not found"
+        
+        try:
+            result = subprocess.run(
+                [cli_path] + args,
+                capture_output=True,
+                timeout=timeout
+            )
+            
+            if result.returncode == 0:
+                return True, result.stdout
+            else:
+                return False, result.stderr or result.stdout
+                
+        except subprocess.TimeoutExpired:
+            return False, b"Command timed out"
+        except Exception as e:
+            return False, str(e).encode('utf-8')
+    
+    async def _run_cli_async(self, args: List[str], timeout: int = 30) -> Tuple[bool, bytes]:
+        """
+        Run an LM Studio CLI command without blocking the event loop.
+        
+        Lets independent queries run side by side (see snapshot()).
+        
+        Returns:
+            Tuple of (success, raw output)
+        """
+        cli_path = self._get_cli_path()
+        if not cli_path:
+            return False, b"LM Studio CLI not found"
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                cli_path, *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return False, str(e).encode('utf-8')
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, b"Command timed out"
+        
+        if proc.returncode == 0:
+            return True, stdout
+        return False, stderr or stdout
+    
+    async def snapshot(
+        self,
+        include_downloaded: bool = True
+    ) -> Tuple[bool, List[str], Optional[List[ModelInfo]]]:
+        """
+        Query server state, loaded models and downloaded models concurrently.
+        
+        Args:
+            include_downloaded: Also run `lms ls` (skip if already cached)
+        
+        Returns:
+            Tuple of (server running, loaded model ids, downloaded models or
+            None if not requested / failed)
+        """
+        queries = [
+            asyncio.to_thread(self.is_server_running),
+            self._run_cli_async(['ps', '--json'], timeout=10),
+        ]
+        if include_downloaded:
+            queries.append(self._run_cli_async(['ls', '--json'], timeout=30))
+        
+        results = await asyncio.gather(*queries)
+        
+        running = results[0]
+        success, output = results[1]
+        loaded = self._parse_loaded_models(output) if success else []
+        downloaded = None
+        if include_downloaded and results[2][0]:
+            downloaded = self._parse_downloaded_models(results[2][1])
+        
+        return running, loaded, downloaded
+    
     # =========================================================================
     # SERVER CONTROL
     # =========================================================================
     
     def is_server_running(self) -> bool:
-        """Check if LM Studio server is running."""
+        """Check if LM Studio server is running (cached for SERVER_STATE_TTL seconds)."""
+        now = time.monotonic()
+        if now < self._server_state_expiry:
+            return self._server_running
+        
+        self._set_server_state(*self._probe_server())
+        return self._server_running
+    
+    def _probe_server(self) -> Tuple[bool, float]:
+        """
+        Check the server directly, bypassing the cached state.
+        
+        Returns:
+            Tuple of (running, seconds the result may be cached)
+        """
         # Quick HTTP check first (faster than CLI)
-        try:
-            import urllib.request
-            req = urllib.request.Request("http://localhost:1234/v1/models")
-            with urllib.request.urlopen(req, timeout=2) as response:
-                return response.status == 200
-        except:
-            pass
+        http_state = self._http_probe(timeout=2)
+        if http_state:
+            return True, SERVER_STATE_TTL
         
         # Fall back to CLI check
         success, output = self._run_cli(['server', 'status'], timeout=5)
-        return success and 'running' in output.lower()
+        running = success and 'running' in output.lower()
+        
+        if http_state is None:
+            # HTTP timed out or failed oddly: trust the answer for less time
+            ttl = SERVER_STATE_TTL / 2 if running else SERVER_STATE_UNCERTAIN_TTL
+        else:
+            ttl = SERVER_STATE_TTL
+        return running, ttl
+    
+    @staticmethod
+    def _http_probe(timeout: float) -> Optional[bool]:
+        """
+        Probe the server over HTTP on the default port.
+        
+        Returns:
+            True if it answered, False if the connection was refused (or it
+            answered with an error), None if the outcome is unclear (timeout)
+        """
+        try:
+            status, _ = http_request('GET', "http://localhost:1234/v1/models", timeout=timeout)
+            return status == 200
+        except ConnectionRefusedError:
+            return False
+        except (OSError, http.client.HTTPException):
+            return None
+    
+    @staticmethod
+    def _quick_http_probe(timeout: float = 0.25) -> bool:
+        """Check whether the server answers HTTP on the default port."""
+        return bool(LMStudioManager._http_probe(timeout))
+    
+    def _set_server_state(self, running: bool, ttl: float = SERVER_STATE_TTL):
+        """Remember a fresh server probe result for `ttl` seconds."""
+        self._server_running = running
+        self._server_state_expiry = time.monotonic() + ttl
+    
+    def _invalidate_server_state(self):
+        """Forget the cached server state after starting or stopping it."""
+        self._server_state_expiry = 0.0
     
     def start_server(self, wait: bool = True, timeout: int = 30) -> bool:
         """
@@ -161,26 +422,36 @@ class LMStudioManager:
         
         # Start server in background
         success, output = self._run_cli(['server', 'start'], timeout=10)
+        self._invalidate_server_state()
         
         if not success:
             print(f"Failed to start server: {output}")
             return False
         
         if wait:
-            # Wait for server to be ready
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                if self.is_server_running():
+            # Wait for server to be ready, probing often at first and
+            # backing off so a slow start doesn't spin
+            delay = 0.05
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if self._quick_http_probe(timeout=0.25):
+                    self._set_server_state(True)
                     return True
-                time.sleep(0.5)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 1.0)
             
-            return False
+            # Last full check (also covers servers on another port via the CLI)
+            running, ttl = self._probe_server()
+            self._set_server_state(running, ttl)
+            return running
         
         return True
     
     def stop_server(self) -> bool:
         """Stop the LM Studio server."""
         success, _ = self._run_cli(['server', 'stop'], timeout=10)
+        self._invalidate_server_state()
+        self._invalidate_models_cache()
         return success
     
     # =========================================================================
@@ -194,42 +465,133 @@ class LMStudioManager:
         Args:
             refresh: Force refresh of cached model list
         """
-        if self._cached_models is not None and not refresh:
-            return self._cached_models
+        with self._refresh_lock:
+            cached = self._cached_models
+            if cached is not None and not refresh:
+                return cached
+            
+            # Only one `lms ls` at a time; others keep using the old list
+            if self._refresh_inflight:
+                return cached if cached is not None else []
+            self._refresh_inflight = True
         
-        success, output = self._run_cli(['ls', '--json'], timeout=30)
+        listed = []
+        try:
+            # Built in full before being swapped in below
+            models = list(self._iter_models(listed))
+        finally:
+            with self._refresh_lock:
+                self._refresh_inflight = False
+        
+        if not listed:
+            # The CLI failed: keep serving the old list, and don't retry
+            # before it goes stale again
+            if cached is not None:
+                self._store_models_cache(cached)
+                return cached
+            return models
         
-        if not success:
-            return []
+        # An empty list is a real answer too, and is cached as such
+        self._store_models_cache(models)
+        return models
+    
+    def is_models_cache_stale(self) -> bool:
+        """Check if the cached model list is older than MODELS_CACHE_TTL."""
+        return (
+            self._cached_models is not None
+            and time.monotonic() - self._models_cached_at > MODELS_CACHE_TTL
+        )
+    
+    def _store_models_cache(self, models: List[ModelInfo]):
+        """Cache a freshly listed set of models."""
+        with self._refresh_lock:
+            self._cached_models = models
+            self._models_cached_at = time.monotonic()
+    
+    def _invalidate_models_cache(self):
+        """Drop the cached model list after a state-changing command."""
+        self._cached_models = None
+    
+    def iter_downloaded_models(self, timeout: int = 30) -> Iterator[ModelInfo]:
+        """
+        Yield downloaded models as `lms ls --json` writes them (uncached).
+        
+        With ijson installed the CLI output is parsed incrementally, so
+        models are available before the whole listing has been produced.
+        """
+        yield from self._iter_models([], timeout)
+    
+    def _iter_models(self, listed: list, timeout: int = 30) -> Iterator[ModelInfo]:
+        """
+        iter_downloaded_models(), appending True to `listed` once the CLI
+        has produced a complete listing (so an empty result can be told
+        apart from a failed one).
+        """
+        cli_path = self._get_cli_path()
+        if ijson is None or not cli_path:
+            success, output = self._run_cli_bytes(['ls', '--json'], timeout=timeout)
+            if success:
+                yield from self._parse_downloaded_models(output)
+                listed.append(True)
+            return
         
         try:
-            data = json.loads(output)
+            proc = subprocess.Popen(
+                [cli_path, 'ls', '--json'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception:
+            return
+        
+        # Kill the CLI if it hangs, which also ends the parse below
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        yielded = False
+        parsed = False
+        try:
+            for item in ijson.items(proc.stdout, 'item', use_float=True):
+                model = _model_from_json(item)
+                if model is not None:
+                    yielded = True
+                    yield model
+            parsed = True
+        except ijson.JSONError:
+            if not yielded:
+                # Not JSON (older CLI): use the plain-text parser instead
+                success, output = self._run_cli_bytes(['ls', '--json'], timeout=timeout)
+                if success:
+                    yield from self._parse_downloaded_models(output)
+                    listed.append(True)
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        
+        # A CLI killed by the watchdog or failing leaves a partial listing
+        if parsed and proc.returncode == 0:
+            listed.append(True)
+    
+    @staticmethod
+    def _parse_downloaded_models(output: bytes) -> List[ModelInfo]:
+        """Parse the output of `lms ls --json`."""
+        try:
+            data = _json_loads(output)
             models = []
             
             for item in data:
-                # Handle different possible JSON structures
-                if isinstance(item, dict):
-                    path = item.get('path', item.get('id', ''))
-                    name = item.get('name', path.split('/')[-1] if '/' in path else path)
-                    size = item.get('size', item.get('sizeBytes', 0))
-                    quant = item.get('quantization', '')
-                    arch = item.get('architecture', '')
-                    
-                    models.append(ModelInfo(
-                        path=path,
-                        name=name,
-                        size_bytes=size,
-                        quantization=quant,
-                        architecture=arch
-                    ))
+                model = _model_from_json(item)
+                if model is not None:
+                    models.append(model)
             
-            self._cached_models = models
             return models
             
         except json.JSONDecodeError:
             # Try line-by-line parsing for simpler output
             models = []
-            for line in output.strip().split('\n'):
+            for line in output.decode('utf-8', errors='replace').strip().split('\n'):
                 line = line.strip()
                 if line and not line.startswith(('#', '-')):
                     models.append(ModelInfo(
@@ -240,18 +602,22 @@ class LMStudioManager:
                         architecture=''
                     ))
             
-            self._cached_models = models
             return models
     
     def list_loaded_models(self) -> List[str]:
         """Get list of currently loaded model identifiers."""
-        success, output = self._run_cli(['ps', '--json'], timeout=10)
+        success, output = self._run_cli_bytes(['ps', '--json'], timeout=10)
         
         if not success:
             return []
         
+        return self._parse_loaded_models(output)
+    
+    @staticmethod
+    def _parse_loaded_models(output: bytes) -> List[str]:
+        """Parse the output of `lms ps --json`."""
         try:
-            data = json.loads(output)
+            data = _json_loads(output)
             if isinstance(data, list):
                 return [item.get('id', item.get('path', '')) for item in data if isinstance(item, dict)]
             return []
@@ -293,11 +659,13 @@ class LMStudioManager:
             print(f"Failed to load model: {output}")
             return False
         
+        self._invalidate_models_cache()
         return True
     
     def unload_all(self) -> bool:
         """Unload all currently loaded models."""
         success, _ = self._run_cli(['unload', '--all'], timeout=30)
+        self._invalidate_models_cache()
         return success
     
     # =========================================================================
@@ -319,17 +687,26 @@ class LMStudioManager:
         if not self.is_cli_available():
             return False
         
-        if not self.start_server():
+        if not auto_load_model:
+            return self.start_server()
+        
+        # Probe the server and list loaded (and, if not cached, downloaded)
+        # models at the same time instead of one CLI start after another
+        running, loaded, downloaded = asyncio.run(
+            self.snapshot(include_downloaded=self._cached_models is None)
+        )
+        if downloaded:
+            self._store_models_cache(downloaded)
+        
+        if not running and not self.start_server():
             return False
         
-        if auto_load_model:
-            loaded = self.list_loaded_models()
-            if not loaded:
-                # Try to load the first available model
-                model = self.get_recommended_model()
-                if model:
-                    return self.load_model(model.path)
-                return False
+        if not loaded:
+            # Try to load the first available model
+            model = self.get_recommended_model()
+            if model:
+                return self.load_model(model.path)
+            return False
         
         return True
     
@@ -344,16 +721,9 @@ class LMStudioManager:
         if not models:
             return None
         
-        # Prefer higher quality quantizations (Q8 > Q6 > Q5 > Q4)
-        preferred_quants = ['Q8', 'Q6_K', 'Q5_K_M', 'Q5_K_S', 'Q4_K_M', 'Q4_K_S', '8bit', '4bit']
-        
-        for quant in preferred_quants:
-            for model in models:
-                if quant.lower() in str(model.quantization).lower():
-                    return model
-        
-        # Return the first model if no preferred quantization found
-        return models[0] if models else None
+        # Best-ranked quantization wins; min() keeps list order among ties,
+        # so the first model is returned if none has a preferred quantization
+        return min(models, key=lambda model: model._quant_rank)
     
     def get_current_model(self) -> Optional[str]:
         """Get the currently loaded model name, if any."""
@@ -10,29 +10,30 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-import qdarktheme
+# Enable high DPI scaling (must be set before Qt is loaded)
+os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
 
-from ui.main_window import MainWindow
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QFont, QFontDatabase
 
 
 def main():
-    # Enable high DPI scaling
-    os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
-    
     app = QApplication(sys.argv)
     app.setApplicationName("Whispered")
     app.setApplicationDisplayName("Whispered")
     
-    # Set modern font
-    font = QFont("Inter", 10)
-    if not font.exactMatch():
-        font = QFont("Roboto", 10)
-    if not font.exactMatch():
-        font = QFont("Sans Serif", 10)
-    app.setFont(font)
+    # Set modern font (one font database lookup instead of a probe per font)
+    families = set(QFontDatabase.families())
+    family = next(
+        (name for name in ("Inter", "Roboto") if name in families),
+        "Sans Serif"
+    )
+    app.setFont(QFont(family, 10))
+    
+    # Theme and main window are imported only once the application exists,
+    # so the heavy UI modules don't delay QApplication startup
+    import qdarktheme
+    from ui.main_window import MainWindow
     
     # Apply dark theme
     qdarktheme.setup_theme(
@@ -3,12 +3,31 @@ Whisper Fedora - Text Processing Module
 AI-powered text cleaning and coherence processing using LM Studio
 """
 
+import re
 import json
-import urllib.request
-import urllib.error
+import time
+import sqlite3
+import hashlib
+import threading
+import http.client
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from difflib import SequenceMatcher
+from typing import Optional, Callable, Dict, Iterable, Iterator, Tuple
 from enum import Enum
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to ujson, then stdlib json
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # Optional: only used when orjson is missing
+    ujson = None
 
 
 # ============================================================================
@@ -20,9 +39,42 @@ DEFAULT_MAX_TOKENS = 4096
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_TIMEOUT = 300  # 5 minutes for long texts
 
+# How long a successful connection check is trusted (seconds)
+CONNECTION_CHECK_TTL = 5.0
+
 # Chunk size for processing long texts (in characters)
 TEXT_CHUNK_SIZE = 8000
-TEXT_CHUNK_OVERLAP = 500
+
+# Tail of the previous chunk shown to the model as context (not re-cleaned)
+TEXT_CHUNK_CONTEXT = 200
+
+# Cleaned text shorter than this (in sentences or characters) skips the
+# AI coherence pass; it fits in a single paragraph anyway
+COHERENCE_MIN_SENTENCES = 4
+COHERENCE_MIN_CHARS = 400
+
+# Cleaning and structuring return about as much text as they are given.
+# Output tokens are capped at TEXT_TOKEN_BUDGET_RATIO of the input length in
+# characters, plus slack, so a runaway response stops early. Chinese,
+# Japanese and Korean take about one token per character, so the ratio
+# can't go below 1.
+TEXT_TOKEN_BUDGET_RATIO = 1.0
+TEXT_TOKEN_BUDGET_SLACK = 256
+
+# The prompts wrap the text in "---" lines; a model that echoes the closing
+# delimiter has finished
+PROMPT_STOP_SEQUENCES = ["\n---"]
+
+# Concurrent chunk requests sent to LM Studio for long texts
+MAX_PARALLEL_CHUNKS = 4
+
+# Shortest repeated run treated as the overlap when joining cleaned chunks
+MIN_OVERLAP_MATCH = 40
+
+# LLM responses kept in memory, and the on-disk copy shared across runs
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_DISK_ROWS = 5000
+RESPONSE_CACHE_FILE = Path.home() / ".cache" / "whisper-fedora" / "llm_cache.sqlite"
 
 
 # ============================================================================
@@ -37,13 +89,18 @@ class CleanedText:
     removed_fillers: int
     sentences_fixed: int
     paragraphs_created: int
+    _improvement_ratio: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if len(self.original) == 0:
+            self._improvement_ratio = 0.0
+        else:
+            self._improvement_ratio = 1.0 - (len(self.cleaned) / len(self.original))
     
     @property
     def improvement_ratio(self) -> float:
         """How much shorter the cleaned text is vs original."""
-        if len(self.original) == 0:
-            return 0.0
-        return 1.0 - (len(self.cleaned) / len(self.original))
+        return self._improvement_ratio
 
 
 @dataclass
@@ -68,43 +125,233 @@ class ProcessingResult:
 # LM STUDIO CLIENT
 # ============================================================================
 
+def _json_dumps(value) -> bytes:
+    """Encode a request payload as UTF-8 JSON (orjson/ujson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    if ujson is not None:
+        return ujson.dumps(value, ensure_ascii=False).encode('utf-8')
+    return json.dumps(value).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON response body (orjson/ujson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+# Keep-alive connections, one per (scheme, host) per thread.
+# http.client connections are not thread-safe, so each thread gets its own.
+_http_local = threading.local()
+
+# Errors meaning a pooled keep-alive socket was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+def _open_response(
+    method: str,
+    url: str,
+    body: Optional[bytes],
+    headers: Optional[Dict[str, str]],
+    timeout: float
+) -> Tuple[dict, tuple, http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Send a request on the pooled connection and return its response headers."""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    
+    request_headers = {'Connection': 'keep-alive'}
+    if headers:
+        request_headers.update(headers)
+    
+    connections = getattr(_http_local, 'connections', None)
+    if connections is None:
+        connections = _http_local.connections = {}
+    
+    while True:
+        conn = connections.get(key)
+        reused = conn is not None
+        if conn is None:
+            if parts.scheme == 'https':
+                conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout)
+            else:
+                conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+            connections[key] = conn
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            return connections, key, conn, conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            connections.pop(key, None)
+            if reused:
+                continue  # Server dropped the idle socket; retry on a new one
+            raise
+        except BaseException:
+            conn.close()
+            connections.pop(key, None)
+            raise
+
+
+def _release_connection(
+    connections: dict,
+    key: tuple,
+    conn: http.client.HTTPConnection,
+    response: http.client.HTTPResponse,
+    reusable: bool
+):
+    """Keep a connection for the next request, or close it."""
+    if reusable and not response.will_close:
+        return
+    conn.close()
+    if connections.get(key) is conn:
+        del connections[key]
+
+
+def http_request(
+    method: str,
+    url: str,
+    body: Optional[bytes] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 5
+) -> Tuple[int, bytes]:
+    """
+    Send an HTTP request over a pooled keep-alive connection.
+    
+    Repeated calls to the same host (e.g. the local LM Studio server)
+    reuse one socket instead of reconnecting every time.
+    
+    Returns:
+        Tuple of (status, body)
+    
+    Raises:
+        OSError or http.client.HTTPException on connection failure
+    """
+    connections, key, conn, response = _open_response(method, url, body, headers, timeout)
+    reusable = False
+    try:
+        data = response.read()
+        reusable = True
+    finally:
+        _release_connection(connections, key, conn, response, reusable)
+    return response.status, data
+
+
+def http_stream_lines(
+    method: str,
+    url: str,
+    body: Optional[bytes] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 5
+) -> Iterator[bytes]:
+    """
+    Send an HTTP request and yield the response body line by line.
+    
+    Uses the same pooled connections as http_request(). The connection is
+    only reused if the body is read to the end.
+    
+    Raises:
+        OSError or http.client.HTTPException on connection failure or a
+        non-200 status
+    """
+    connections, key, conn, response = _open_response(method, url, body, headers, timeout)
+    reusable = False
+    try:
+        if response.status != 200:
+            response.read()
+            reusable = True
+            raise http.client.HTTPException(f"HTTP {response.status} from {url}")
+        
+        for line in response:
+            yield line
+        response.read()  # Marks a Content-Length body as finished
+        reusable = True
+    finally:
+        _release_connection(connections, key, conn, response, reusable)
+
+
 class LMStudioClient:
     """Client for communicating with LM Studio's OpenAI-compatible API."""
     
     def __init__(self, base_url: str = DEFAULT_LM_STUDIO_URL):
         self.base_url = base_url.rstrip('/')
         self._cached_model: Optional[str] = None
+        self._model_checked_until = 0.0
+        self.response_cache: Optional["ResponseCache"] = None
+        self._connection_ok_until = 0.0
     
     def check_connection(self) -> bool:
-        """Check if LM Studio server is running and accessible."""
+        """
+        Check if LM Studio server is running and accessible.
+        
+        A successful check is reused for CONNECTION_CHECK_TTL seconds, so
+        the cleaning and coherence stages of one run don't re-probe.
+        """
+        if time.monotonic() < self._connection_ok_until:
+            return True
+        
         try:
-            req = urllib.request.Request(f"{self.base_url}/models")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.status == 200
-        except:
-            return False
+            status, _ = http_request('GET', f"{self.base_url}/models", timeout=5)
+        except (OSError, http.client.HTTPException):
+            status = None
+        
+        if status == 200:
+            self._connection_ok_until = time.monotonic() + CONNECTION_CHECK_TTL
+            return True
+        self._connection_ok_until = 0.0
+        return False
     
     def get_loaded_model(self) -> Optional[str]:
         """Get the currently loaded model name."""
         try:
-            req = urllib.request.Request(f"{self.base_url}/models")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            status, body = http_request('GET', f"{self.base_url}/models", timeout=5)
+            if status == 200:
+                data = _json_loads(body)
                 models = data.get('data', [])
                 if models:
                     self._cached_model = models[0].get('id', 'Unknown')
+                    self._model_checked_until = time.monotonic() + CONNECTION_CHECK_TTL
                     return self._cached_model
-        except:
+        except (OSError, http.client.HTTPException):
             pass
+        except (ValueError, AttributeError, TypeError):
+            pass  # Unexpected response body
         return None
     
+    def _current_model(self) -> Optional[str]:
+        """
+        Get the loaded model's id, as of at most CONNECTION_CHECK_TTL
+        seconds ago, so the chunks of one run share a lookup.
+        """
+        if time.monotonic() < self._model_checked_until:
+            return self._cached_model
+        return self.get_loaded_model()
+    
     def chat_completion(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         temperature: float = DEFAULT_TEMPERATURE,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        on_delta: Optional[Callable[[str], None]] = None,
+        stop: Optional[list[str]] = None,
+        on_finish: Optional[Callable[[str], None]] = None
     ) -> Optional[str]:
         """
         Send a chat completion request to LM Studio.
@@ -115,44 +362,303 @@ class LMStudioClient:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0-1)
             timeout: Request timeout in seconds
+            on_delta: Optional callback for each piece of text as it streams in
+            stop: Optional sequences that end the response early
+            on_finish: Optional callback for the finish reason ("stop",
+                "length", ...) when the server reports one
             
         Returns:
             The model's response text, or None on error
         """
+        try:
+            pieces = []
+            for piece in self.chat_completion_stream(
+                prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=timeout,
+                stop=stop,
+                on_finish=on_finish
+            ):
+                pieces.append(piece)
+                if on_delta:
+                    on_delta(piece)
+            return "".join(pieces)
+                
+        except (OSError, http.client.HTTPException) as e:
+            # Silenced - these errors can be frequent during connection checks
+            # print(f"LM Studio connection error: {e}")
+            self._connection_ok_until = 0.0  # Probe again next time
+            return None
+        except Exception as e:
+            # Silenced - avoid console spam
+            # print(f"LM Studio API error: {e}")
+            return None
+    
+    def cached_chat_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        timeout: int = DEFAULT_TIMEOUT,
+        on_delta: Optional[Callable[[str], None]] = None,
+        stop: Optional[list[str]] = None
+    ) -> Optional[str]:
+        """
+        chat_completion() that reuses identical earlier requests.
+        
+        Looks the request up in response_cache first and stores successful
+        responses there; responses cut off by max_tokens are not stored.
+        Entries are keyed by the model loaded in LM Studio, so switching
+        models there doesn't return the old model's responses. Behaves
+        exactly like chat_completion() when no cache is attached or the
+        model can't be determined. on_delta is not called for cache hits.
+        """
+        cache = self.response_cache
+        model = self._current_model() if cache is not None else None
+        if model is None:
+            return self.chat_completion(
+                prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=timeout,
+                on_delta=on_delta,
+                stop=stop
+            )
+        
+        key = ResponseCache.make_key(
+            self.base_url, model, system_prompt, prompt,
+            temperature, max_tokens, stop
+        )
+        result = cache.get(key)
+        if result is not None:
+            return result
+        
+        finish_reasons = []
+        result = self.chat_completion(
+            prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout,
+            on_delta=on_delta,
+            stop=stop,
+            on_finish=finish_reasons.append
+        )
+        if result and 'length' not in finish_reasons:
+            cache.put(key, result)
+        return result
+    
+    def chat_completion_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        timeout: int = DEFAULT_TIMEOUT,
+        stop: Optional[list[str]] = None,
+        on_finish: Optional[Callable[[str], None]] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion from LM Studio, yielding text as it arrives.
+        
+        Takes the same arguments as chat_completion(). The timeout applies
+        to each read, not to the whole response.
+        
+        Raises:
+            OSError or http.client.HTTPException on connection/HTTP errors
+        """
         endpoint = f"{self.base_url}/chat/completions"
         
-        messages = []
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+        else:
+            messages = [{"role": "user", "content": prompt}]
         
-        payload = {
+        request = {
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "stream": False
+            "stream": True
         }
+        if stop:
+            request["stop"] = stop
+        data = _json_dumps(request)
+        lines = http_stream_lines(
+            'POST',
+            endpoint,
+            body=data,
+            headers={'Content-Type': 'application/json'},
+            timeout=timeout
+        )
         
-        try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                endpoint,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
+        # Server-sent events: one "data: {...}" line per delta
+        for line in lines:
+            line = line.strip()
+            if not line.startswith(b'data:'):
+                continue
             
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return result['choices'][0]['message']['content']
-                
-        except urllib.error.URLError as e:
-            # Silenced - these errors can be frequent during connection checks
-            # print(f"LM Studio connection error: {e}")
-            return None
-        except Exception as e:
-            # Silenced - avoid console spam
-            # print(f"LM Studio API error: {e}")
-            return None
+            event = line[5:].strip()
+            if event == b'[DONE]':
+                break
+            
+            choices = _json_loads(event).get('choices') or [{}]
+            content = choices[0].get('delta', {}).get('content')
+            if content:
+                yield content
+            finish_reason = choices[0].get('finish_reason')
+            if finish_reason and on_finish:
+                on_finish(finish_reason)
+        
+        # Finish reading so the connection can be reused
+        for _ in lines:
+            pass
+
+
+class ResponseCache:
+    """
+    Exact-match cache of LLM responses.
+    
+    Recent responses live in an in-memory LRU; all of them are also written
+    to a small SQLite file so reruns of the same transcript skip LM Studio.
+    The file keeps the newest `disk_rows` responses. The disk tier is
+    best-effort: if the database can't be opened the cache
+    keeps working from memory. Safe to share between threads.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[Path] = RESPONSE_CACHE_FILE,
+        maxsize: int = RESPONSE_CACHE_SIZE,
+        disk_rows: int = RESPONSE_CACHE_DISK_ROWS
+    ):
+        self._path = path
+        self._maxsize = maxsize
+        self._disk_rows = disk_rows
+        self._memory: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_failed = path is None
+    
+    @staticmethod
+    def make_key(*parts) -> bytes:
+        """Hash the request parts into a compact cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(repr(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.digest()
+    
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached response for `key`, or None."""
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                return response
+            
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            
+            self._remember(key, row[0])
+            return row[0]
+    
+    def put(self, key: bytes, response: str):
+        """Store a response in memory and on disk."""
+        with self._lock:
+            self._remember(key, response)
+            
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                        (key, response)
+                    )
+                    # A (re)written row gets the highest rowid, so the
+                    # oldest rows are the lowest ones
+                    db.execute(
+                        "DELETE FROM responses WHERE rowid <= "
+                        "(SELECT MAX(rowid) FROM responses) - ?",
+                        (self._disk_rows,)
+                    )
+            except sqlite3.Error:
+                pass  # Disk tier is optional
+    
+    def _remember(self, key: bytes, response: str):
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use (caller holds the lock)."""
+        if self._db is None and not self._db_failed:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self._path, check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key BLOB PRIMARY KEY, response TEXT NOT NULL)"
+                )
+                self._db = db
+            except (OSError, sqlite3.Error):
+                self._db_failed = True
+        return self._db
+
+
+def _output_token_budget(text: str) -> int:
+    """Max tokens to allow for a response that rewrites `text`."""
+    budget = int(len(text) * TEXT_TOKEN_BUDGET_RATIO) + TEXT_TOKEN_BUDGET_SLACK
+    return min(DEFAULT_MAX_TOKENS, budget)
+
+
+def _streaming_progress(
+    on_progress: Optional[Callable[[int, str], None]],
+    expected_chars: int,
+    start: int,
+    end: int,
+    message: str
+) -> Optional[Callable[[str], None]]:
+    """
+    Build an on_delta callback that maps streamed output to progress.
+    
+    Progress moves from `start` towards `end` as the response approaches
+    `expected_chars`, and is only reported when the percentage changes.
+    """
+    if on_progress is None:
+        return None
+    
+    received = 0
+    last = start
+    
+    def on_delta(piece: str):
+        nonlocal received, last
+        received += len(piece)
+        pct = start + (end - start) * min(received, expected_chars) // max(expected_chars, 1)
+        if pct != last:
+            last = pct
+            on_progress(pct, message)
+    
+    return on_delta
 
 
 # ============================================================================
@@ -168,11 +674,35 @@ FILLER_PATTERNS = [
     "right ", "okay so ", "and so ",
 ]
 
+# All fillers as one case-insensitive alternation (longest first), matched
+# on word boundaries. Patterns written with a trailing space must be
+# followed by whitespace, as with the plain substring matching they replace.
+FILLER_RE = re.compile(
+    "|".join(
+        r"\b" + re.escape(filler.strip()) + (r"(?=\s)" if filler.endswith(" ") else r"\b")
+        for filler in sorted(FILLER_PATTERNS, key=len, reverse=True)
+    ),
+    re.IGNORECASE
+)
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+
+# Paragraph openers treated as topic shifts, plus the marker the AI adds
+TOPIC_SHIFT_MARKER = "[TOPIC SHIFT]"
+_TOPIC_SHIFT_RE = re.compile(r"(?:however|but|now|another|moving on|next)\b", re.IGNORECASE)
+
 CLEANING_SYSTEM_PROMPT = """You are a text editor specializing in cleaning spoken transcriptions.
 Your task is to transform raw speech into clean, readable text while preserving the original meaning.
 Do NOT summarize, add new information, or change the speaker's intent.
 Output ONLY the cleaned text, no explanations or meta-commentary."""
 
+CLEANING_CONTEXT_HINT = """
+The transcription continues from this earlier passage, which is already handled. Use it only as context and do NOT include it in your output:
+---
+{context}
+---"""
+
 CLEANING_PROMPT_TEMPLATE = """Clean this spoken transcription into readable text by:
 
 1. REMOVE filler words: uh, um, er, ah, "you know", "like", "I mean", "kind of", "sort of"
@@ -195,28 +725,21 @@ class TextCleaner:
     def __init__(self, lm_client: Optional[LMStudioClient] = None):
         self.lm_client = lm_client or LMStudioClient()
     
-    def _quick_clean(self, text: str) -> str:
-        """Quick regex-based cleaning for when LM Studio is unavailable."""
-        result = text
-        
-        # Remove common fillers (case-insensitive)
-        for filler in FILLER_PATTERNS:
-            result = result.replace(filler.lower(), " ")
-            result = result.replace(filler.capitalize(), " ")
-        
-        # Clean up multiple spaces
-        while "  " in result:
-            result = result.replace("  ", " ")
+    def _quick_clean(self, text: str) -> Tuple[str, int]:
+        """
+        Quick regex-based cleaning for when LM Studio is unavailable.
         
-        return result.strip()
+        Returns:
+            Tuple of (cleaned text, number of fillers removed)
+        """
+        # Remove common fillers (case-insensitive), then collapse spaces
+        result, removed = FILLER_RE.subn(" ", text)
+        result = _MULTI_SPACE_RE.sub(" ", result)
+        return result.strip(), removed
     
-    def _count_removed_fillers(self, original: str, cleaned: str) -> int:
-        """Estimate number of filler words removed."""
-        count = 0
-        original_lower = original.lower()
-        for filler in FILLER_PATTERNS:
-            count += original_lower.count(filler.lower())
-        return count
+    def _count_removed_fillers(self, original: str) -> int:
+        """Estimate number of filler words the AI pass removed."""
+        return sum(1 for _ in FILLER_RE.finditer(original))
     
     def clean(
         self,
@@ -241,14 +764,20 @@ class TextCleaner:
         # Check if AI is available and requested
         if use_ai and self.lm_client.check_connection():
             cleaned = self._clean_with_ai(text, on_progress)
+            removed_fillers = self._count_removed_fillers(text)
         else:
             if on_progress:
                 on_progress(10, "LM Studio unavailable, using basic cleaning...")
-            cleaned = self._quick_clean(text)
+            # Filler count comes out of the same regex pass
+            cleaned, removed_fillers = self._quick_clean(text)
         
-        # Calculate statistics
-        removed_fillers = self._count_removed_fillers(text, cleaned)
+        if on_progress:
+            on_progress(100, "Text cleaning complete")
         
+        return self._build_result(text, cleaned, removed_fillers)
+    
+    def _build_result(self, text: str, cleaned: str, removed_fillers: int) -> CleanedText:
+        """Calculate statistics for a finished cleaning pass."""
         # Estimate sentences fixed (rough: count new periods added)
         original_periods = text.count('.')
         cleaned_periods = cleaned.count('.')
@@ -257,9 +786,6 @@ class TextCleaner:
         # Count paragraphs
         paragraphs_created = cleaned.count('\n\n') + 1
         
-        if on_progress:
-            on_progress(100, "Text cleaning complete")
-        
         return CleanedText(
             original=text,
             cleaned=cleaned,
@@ -281,36 +807,99 @@ class TextCleaner:
                 on_progress(20, "Processing with AI...")
             
             prompt = CLEANING_PROMPT_TEMPLATE.format(text=text)
-            result = self.lm_client.chat_completion(
+            result = self.lm_client.cached_chat_completion(
                 prompt=prompt,
                 system_prompt=CLEANING_SYSTEM_PROMPT,
-                temperature=0.3  # Lower temperature for more consistent cleaning
+                temperature=0.3,  # Lower temperature for more consistent cleaning
+                max_tokens=_output_token_budget(text),
+                stop=PROMPT_STOP_SEQUENCES,
+                on_delta=_streaming_progress(
+                    on_progress, len(text), 20, 90, "Processing with AI..."
+                )
             )
             
-            return result if result else self._quick_clean(text)
+            return result if result else self._quick_clean(text)[0]
+        
+        # For long texts, clean chunks concurrently and rejoin in order
+        return "\n\n".join(self.iter_cleaned_chunks(text, on_progress))
+    
+    def iter_cleaned_chunks(
+        self,
+        text: str,
+        on_progress: Optional[Callable[[int, str], None]] = None
+    ) -> Iterator[str]:
+        """
+        Clean text chunk by chunk with LM Studio.
         
-        # For long texts, process in chunks
+        Chunks are cleaned concurrently and yielded in order, each as soon
+        as it and every chunk before it are done, so callers can start on
+        the beginning of a long text while the rest is still being cleaned.
+        """
+        # Each chunk sees the end of the one before it as context only
         chunks = self._split_into_chunks(text)
-        cleaned_chunks = []
+        contexts = [""] + [chunk[-TEXT_CHUNK_CONTEXT:] for chunk in chunks[:-1]]
         
-        for i, chunk in enumerate(chunks):
-            progress = int(20 + (70 * i / len(chunks)))
-            if on_progress:
-                on_progress(progress, f"Processing chunk {i+1}/{len(chunks)}...")
-            
-            prompt = CLEANING_PROMPT_TEMPLATE.format(text=chunk)
-            result = self.lm_client.chat_completion(
-                prompt=prompt,
-                system_prompt=CLEANING_SYSTEM_PROMPT,
-                temperature=0.3
-            )
-            
-            cleaned_chunks.append(result if result else self._quick_clean(chunk))
+        if on_progress:
+            on_progress(20, f"Processing {len(chunks)} chunks...")
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CHUNKS, len(chunks))) as executor:
+            futures = [
+                executor.submit(self._clean_chunk, chunk, context)
+                for chunk, context in zip(chunks, contexts)
+            ]
+            previous = None
+            for done, future in enumerate(futures, start=1):
+                cleaned = future.result()
+                if on_progress:
+                    progress = int(20 + (70 * done / len(chunks)))
+                    on_progress(progress, f"Processed chunk {done}/{len(chunks)}...")
+                
+                following = cleaned if previous is None else self._strip_echo(previous, cleaned)
+                previous = cleaned
+                if following:
+                    yield following
+    
+    def _clean_chunk(self, chunk: str, context: str = "") -> str:
+        """Clean one chunk with LM Studio, falling back to regex cleaning."""
+        system_prompt = CLEANING_SYSTEM_PROMPT
+        if context:
+            system_prompt += CLEANING_CONTEXT_HINT.format(context=context)
+        
+        prompt = CLEANING_PROMPT_TEMPLATE.format(text=chunk)
+        result = self.lm_client.cached_chat_completion(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=0.3,
+            max_tokens=_output_token_budget(chunk),
+            stop=PROMPT_STOP_SEQUENCES
+        )
+        return result if result else self._quick_clean(chunk)[0]
+    
+    def _strip_echo(self, previous: str, following: str) -> str:
+        """
+        Drop text at the start of `following` that repeats `previous`.
+        
+        Chunks don't overlap, but the model may still echo the context it
+        was shown. The longest run shared by the end of `previous` and the
+        start of `following`, and anything before it in `following`, is
+        removed. Short runs are left alone.
+        """
+        window = TEXT_CHUNK_CONTEXT
+        tail = previous[-window:]
+        head = following[:window]
+        
+        match = SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(
+            0, len(tail), 0, len(head)
+        )
+        if match.size < MIN_OVERLAP_MATCH:
+            return following
         
-        return "\n\n".join(cleaned_chunks)
+        # Chunks end on sentence boundaries, so punctuation left over from
+        # the echoed sentence goes too
+        return following[match.b + match.size:].lstrip(" \n.,;:!?")
     
     def _split_into_chunks(self, text: str) -> list[str]:
-        """Split text into overlapping chunks for processing."""
+        """Split text into consecutive chunks at sentence boundaries."""
         chunks = []
         start = 0
         
@@ -327,7 +916,7 @@ class TextCleaner:
                         break
             
             chunks.append(text[start:end].strip())
-            start = end - TEXT_CHUNK_OVERLAP
+            start = end
         
         return chunks
 
@@ -389,22 +978,52 @@ class CoherenceProcessor:
             # Basic paragraph splitting
             processed = self._basic_paragraph_split(text)
         
+        if on_progress:
+            on_progress(100, "Structure analysis complete")
+        
+        return self._build_result(processed)
+    
+    def process_chunks(
+        self,
+        chunks: Iterable[str],
+        on_progress: Optional[Callable[[int, str], None]] = None
+    ) -> CoherentText:
+        """
+        Process consecutive pieces of a text for coherence with AI.
+        
+        Each piece is sent to LM Studio as soon as `chunks` yields it, so
+        structuring overlaps with whatever produces the pieces. The caller
+        is expected to have checked the connection.
+        """
+        pieces = []
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_CHUNKS) as executor:
+            futures = []
+            for chunk in chunks:
+                pieces.append(chunk)
+                futures.append(executor.submit(self._process_with_ai, chunk))
+            
+            for done, future in enumerate(futures, start=1):
+                pieces[done - 1] = future.result()
+                if on_progress:
+                    progress = int(100 * done / len(futures))
+                    on_progress(progress, f"Structured chunk {done}/{len(futures)}...")
+        
+        return self._build_result('\n\n'.join(pieces))
+    
+    def _build_result(self, processed: str) -> CoherentText:
+        """Split processed text into paragraphs and find topic shifts."""
         # Parse the result into paragraphs
         paragraphs = [p.strip() for p in processed.split('\n\n') if p.strip()]
         
         # Identify topic shifts (marked with [TOPIC SHIFT] or detected by keywords)
         topic_shifts = []
         for i, para in enumerate(paragraphs):
-            if '[TOPIC SHIFT]' in para or any(
-                para.lower().startswith(word) 
-                for word in ['however', 'but', 'now', 'another', 'moving on', 'next']
-            ):
+            if TOPIC_SHIFT_MARKER in para:
+                topic_shifts.append(i)
+                # Remove the marker
+                paragraphs[i] = para.replace(TOPIC_SHIFT_MARKER, '').strip()
+            elif _TOPIC_SHIFT_RE.match(para):
                 topic_shifts.append(i)
-                # Remove the marker if present
-                paragraphs[i] = para.replace('[TOPIC SHIFT]', '').strip()
-        
-        if on_progress:
-            on_progress(100, "Structure analysis complete")
         
         return CoherentText(
             text='\n\n'.join(paragraphs),
@@ -423,27 +1042,34 @@ class CoherenceProcessor:
             on_progress(30, "Organizing paragraphs with AI...")
         
         prompt = COHERENCE_PROMPT_TEMPLATE.format(text=text)
-        result = self.lm_client.chat_completion(
+        result = self.lm_client.cached_chat_completion(
             prompt=prompt,
             system_prompt=COHERENCE_SYSTEM_PROMPT,
-            temperature=0.3
+            temperature=0.3,
+            max_tokens=_output_token_budget(text),
+            stop=PROMPT_STOP_SEQUENCES,
+            on_delta=_streaming_progress(
+                on_progress, len(text), 30, 90, "Organizing paragraphs with AI..."
+            )
         )
         
         return result if result else text
     
     def _basic_paragraph_split(self, text: str) -> str:
         """Basic paragraph splitting without AI."""
+        # Cut after each sentence-ending mark, once the piece since the last
+        # cut is longer than 10 characters (short fragments run on)
         sentences = []
-        current = ""
-        
-        for char in text:
-            current += char
-            if char in '.!?' and len(current) > 10:
-                sentences.append(current.strip())
-                current = ""
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(text):
+            end = match.end()
+            if end - start > 10:
+                sentences.append(text[start:end].strip())
+                start = end
         
-        if current.strip():
-            sentences.append(current.strip())
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
         
         # Group into paragraphs of ~4 sentences
         paragraphs = []
@@ -463,6 +1089,7 @@ class TextProcessor:
     
     def __init__(self, lm_studio_url: str = DEFAULT_LM_STUDIO_URL):
         self.lm_client = LMStudioClient(lm_studio_url)
+        self.lm_client.response_cache = ResponseCache()
         self.cleaner = TextCleaner(self.lm_client)
         self.coherence = CoherenceProcessor(self.lm_client)
     
@@ -474,6 +1101,16 @@ class TextProcessor:
         """Get the currently loaded model name."""
         return self.lm_client.get_loaded_model()
     
+    def _is_short(self, text: str) -> bool:
+        """Check whether text is too short to need restructuring."""
+        if len(text) < COHERENCE_MIN_CHARS:
+            return True
+        # Stop counting once there are enough sentences
+        for count, _ in enumerate(_SENTENCE_END_RE.finditer(text), start=1):
+            if count >= COHERENCE_MIN_SENTENCES:
+                return False
+        return True
+    
     def process(
         self,
         raw_text: str,
@@ -491,26 +1128,47 @@ class TextProcessor:
         Returns:
             ProcessingResult with all processing stages
         """
-        import time
         start_time = time.time()
         
-        # Stage 1: Clean text
         def clean_progress(pct, msg):
             if on_progress:
                 on_progress(int(pct * 0.5), f"Cleaning: {msg}")
         
-        cleaned = self.cleaner.clean(raw_text, use_ai=use_ai, on_progress=clean_progress)
-        
-        # Stage 2: Coherence processing
         def coherence_progress(pct, msg):
             if on_progress:
                 on_progress(50 + int(pct * 0.5), f"Structuring: {msg}")
         
-        coherent = self.coherence.process(
-            cleaned.cleaned, 
-            use_ai=use_ai, 
-            on_progress=coherence_progress
-        )
+        if use_ai and len(raw_text) > TEXT_CHUNK_SIZE and self.lm_client.check_connection():
+            # Long texts: structure each cleaned chunk while later ones are
+            # still being cleaned
+            cleaned_chunks = []
+            
+            def cleaned_stream():
+                for chunk in self.cleaner.iter_cleaned_chunks(raw_text, clean_progress):
+                    cleaned_chunks.append(chunk)
+                    yield chunk
+            
+            coherent = self.coherence.process_chunks(cleaned_stream(), coherence_progress)
+            cleaned = self.cleaner._build_result(
+                raw_text,
+                '\n\n'.join(cleaned_chunks),
+                self.cleaner._count_removed_fillers(raw_text)
+            )
+        else:
+            # Stage 1: Clean text
+            cleaned = self.cleaner.clean(raw_text, use_ai=use_ai, on_progress=clean_progress)
+            
+            # Stage 2: Coherence processing (a second model round trip only
+            # pays off once there is more than a paragraph of text)
+            if use_ai and self._is_short(cleaned.cleaned):
+                coherent = self.coherence._build_result(cleaned.cleaned)
+                coherence_progress(100, "Short text, kept as is")
+            else:
+                coherent = self.coherence.process(
+                    cleaned.cleaned, 
+                    use_ai=use_ai, 
+                    on_progress=coherence_progress
+                )
         
         processing_time = time.time() - start_time
         
@@ -3,18 +3,245 @@ Whisper Fedora UI - Transcription Backend
 Wrapper for pywhispercpp to handle transcription tasks
 """
 
+import gc
+import inspect
+import itertools
 import os
+import sys
 import threading
 import tempfile
 import subprocess
 import shutil
+import time
+import queue
+import wave
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Optional, List
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from functools import cached_property, lru_cache
+from typing import Callable, Optional, List, Tuple, Union
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, Qt
 
 from pywhispercpp.model import Model
 
-from utils import get_models_dir, detect_gpu
+try:
+    import numpy as np
+except ImportError:  # Optional: without it, FFmpeg output goes through a temp WAV file
+    np = None
+
+try:
+    import av
+except ImportError:  # Optional: in-process decoding, the FFmpeg CLI is used otherwise
+    av = None
+
+try:
+    from silero_vad import load_silero_vad, get_speech_timestamps
+except ImportError:  # Optional: whisper.cpp then also decodes silent stretches
+    load_silero_vad = None
+    get_speech_timestamps = None
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except ImportError:  # Optional: CTranslate2 backend, pywhispercpp is used otherwise
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
+from config import get_config
+from utils import (
+    get_models_dir, detect_gpu, detect_isa, find_executable, throttle_progress,
+    CPU_ISAS, WHISPER_MODELS
+)
+
+
+# Audio windows decoded together by faster-whisper's batched pipeline
+FASTER_WHISPER_BATCH_SIZE = 16
+
+# ggml quantizations tried for precision "auto", smallest first
+GGML_QUANTIZATIONS = ('q4_0', 'q4_k', 'q5_0', 'q5_k', 'q5_1', 'q8_0')
+
+# Names whisper.cpp's quantize tool is installed under
+QUANTIZE_TOOLS = ('whisper-quantize', 'quantize')
+
+# faster-whisper compute type for each precision setting, on CUDA and CPU
+CUDA_COMPUTE_TYPES = {'auto': 'float16', 'full': 'float32'}
+CPU_COMPUTE_TYPES = {'auto': 'int8', 'full': 'float32'}
+
+# Devices faster-whisper (CTranslate2) can run on
+FASTER_WHISPER_DEVICES = ('cuda', 'cpu')
+
+# Audio window the OpenVINO pipeline transcribes at a time (seconds)
+OPENVINO_CHUNK_LENGTH = 30
+
+# Loaded models (whisper.cpp or faster-whisper) kept by a Transcriber between
+# jobs. Two, so switching back and forth between two models doesn't reload
+# each time; a load that runs out of memory frees the other one and retries.
+MODEL_CACHE_SIZE = 2
+
+# How long a listing of downloaded models is reused (seconds)
+AVAILABLE_MODELS_TTL = 2.0
+
+# Sample rate whisper expects (Hz)
+WHISPER_SAMPLE_RATE = 16000
+
+# A decoded file: a path on disk, or float32 mono samples at WHISPER_SAMPLE_RATE
+Audio = Union[str, "np.ndarray"]
+
+# Silence shorter than this stays in the audio whisper.cpp sees (ms)
+VAD_MIN_SILENCE_MS = 500
+
+# Skip the VAD cut when it would keep more than this share of the audio
+VAD_MAX_KEPT_RATIO = 0.95
+
+# Silero VAD model, loaded on first use (one at a time, it keeps state)
+_vad_model = None
+_vad_lock = threading.Lock()
+
+# OpenVINO speech pipeline of the last model used, as (model name, pipeline)
+_openvino_pipeline = (None, None)
+_openvino_lock = threading.Lock()
+
+
+def _decode_audio(input_path: str) -> Optional["np.ndarray"]:
+    """
+    Decode an audio/video file in-process with PyAV.
+    
+    Returns float32 mono samples at WHISPER_SAMPLE_RATE, or None if PyAV
+    is not installed or the file has no decodable audio.
+    """
+    if av is None or np is None:
+        return None
+    
+    try:
+        with av.open(input_path) as container:
+            if not container.streams.audio:
+                return None
+            stream = container.streams.audio[0]
+            resampler = av.AudioResampler(
+                format='flt', layout='mono', rate=WHISPER_SAMPLE_RATE
+            )
+            
+            chunks = []
+            for frame in container.decode(stream):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+            # Flush samples still buffered in the resampler
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+    except Exception:
+        return None
+    
+    if not chunks:
+        return None
+    return np.concatenate(chunks)
+
+
+def _read_pcm_wav(input_path: str) -> Optional["np.ndarray"]:
+    """
+    Read a WAV file that is already 16 kHz mono 16-bit PCM.
+    
+    Returns float32 samples, or None if numpy is missing or the file is in
+    any other format.
+    """
+    if np is None:
+        return None
+    
+    try:
+        with wave.open(input_path, 'rb') as wav:
+            if (wav.getnchannels() != 1 or wav.getsampwidth() != 2
+                    or wav.getframerate() != WHISPER_SAMPLE_RATE
+                    or wav.getcomptype() != 'NONE'):
+                return None
+            data = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None
+    
+    samples = np.frombuffer(data, dtype='<i2').astype(np.float32)
+    samples *= 1.0 / 32768.0
+    return samples
+
+
+def _decode_with_ffmpeg(input_path: str) -> Optional["np.ndarray"]:
+    """
+    Decode an audio/video file by streaming raw PCM from FFmpeg's stdout.
+    
+    Returns float32 mono samples at WHISPER_SAMPLE_RATE, or None if FFmpeg
+    or numpy is not available or decoding failed.
+    """
+    ffmpeg = find_executable('ffmpeg')
+    if np is None or ffmpeg is None:
+        return None
+    
+    try:
+        result = subprocess.run([
+            ffmpeg, '-nostdin', '-i', input_path,
+            '-f', 's16le',                       # Raw 16-bit PCM, no WAV header
+            '-ar', str(WHISPER_SAMPLE_RATE),
+            '-ac', '1',                          # Mono
+            'pipe:1'
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=3600)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    
+    if result.returncode != 0 or not result.stdout:
+        return None
+    
+    samples = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+    samples *= 1.0 / 32768.0
+    return samples
+
+
+def _speech_only(samples: "np.ndarray") -> Optional[Tuple["np.ndarray", List[Tuple[float, float]]]]:
+    """
+    Cut silence out of decoded samples with Silero VAD.
+    
+    Returns (speech samples, offsets), where offsets holds one
+    (start in the cut audio, start in the original) pair in seconds per
+    kept span. Returns None if VAD is unavailable, finds no speech, or
+    would cut too little to be worth it.
+    """
+    global _vad_model
+    if get_speech_timestamps is None:
+        return None
+    
+    try:
+        import torch
+        with _vad_lock:
+            if _vad_model is None:
+                _vad_model = load_silero_vad()
+            spans = get_speech_timestamps(
+                torch.from_numpy(samples),
+                _vad_model,
+                sampling_rate=WHISPER_SAMPLE_RATE,
+                min_silence_duration_ms=VAD_MIN_SILENCE_MS
+            )
+    except Exception:
+        return None
+    
+    kept = sum(span['end'] - span['start'] for span in spans)
+    if not spans or kept > len(samples) * VAD_MAX_KEPT_RATIO:
+        return None
+    
+    pieces = []
+    offsets = []
+    position = 0
+    for span in spans:
+        offsets.append((position / WHISPER_SAMPLE_RATE, span['start'] / WHISPER_SAMPLE_RATE))
+        pieces.append(samples[span['start']:span['end']])
+        position += span['end'] - span['start']
+    return np.concatenate(pieces), offsets
+
+
+def _restore_times(segments: List["Segment"], offsets: List[Tuple[float, float]]) -> None:
+    """Map segment times from VAD-cut audio back to the original timeline."""
+    cut_starts = [cut for cut, _ in offsets]
+    for seg in segments:
+        # A start belongs to the span it falls in; an end exactly on a
+        # boundary still belongs to the span before it
+        i = max(bisect_right(cut_starts, seg.start) - 1, 0)
+        seg.start += offsets[i][1] - offsets[i][0]
+        i = max(bisect_left(cut_starts, seg.end) - 1, 0)
+        seg.end += offsets[i][1] - offsets[i][0]
 
 
 def _convert_to_wav(input_path: str) -> Optional[str]:
@@ -22,7 +249,8 @@ def _convert_to_wav(input_path: str) -> Optional[str]:
     Convert audio/video file to WAV format using FFmpeg.
     Returns path to temporary WAV file, or None if FFmpeg not available.
     """
-    if not shutil.which('ffmpeg'):
+    ffmpeg = find_executable('ffmpeg')
+    if ffmpeg is None:
         return None
     
     # Create temporary file
@@ -33,7 +261,7 @@ def _convert_to_wav(input_path: str) -> Optional[str]:
     try:
         # Convert to 16kHz mono WAV (optimal for Whisper)
         result = subprocess.run([
-            'ffmpeg', '-y', '-i', input_path,
+            ffmpeg, '-y', '-i', input_path,
             '-ar', '16000',  # 16kHz sample rate
             '-ac', '1',       # Mono
             '-c:a', 'pcm_s16le',  # 16-bit PCM
@@ -53,7 +281,7 @@ FORMATS_NEEDING_CONVERSION = {'.m4a', '.aac', '.wma', '.opus', '.ogg', '.flac',
                                '.mp4', '.mkv', '.avi', '.mov', '.webm', '.wmv', '.flv', '.m4v'}
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Represents a transcription segment with timing."""
     start: float  # Start time in seconds
@@ -69,20 +297,665 @@ class TranscriptionResult:
     language: str
     duration: float
     
-    @property
+    @cached_property
     def full_text(self) -> str:
-        """Get the complete transcription as plain text."""
-        return ' '.join(seg.text.strip() for seg in self.segments)
+        """Get the complete transcription as plain text (built once)."""
+        return ' '.join([seg.text.strip() for seg in self.segments])
 
 
-class TranscriptionWorker(QThread):
-    """Worker thread for running transcription in background."""
+def _is_quantized(model_name: str) -> bool:
+    """Check for a ggml quantization suffix such as '-q5_0'."""
+    _, sep, suffix = model_name.rpartition('-')
+    return bool(sep) and suffix in GGML_QUANTIZATIONS
+
+
+def _resolve_model(model_name: str) -> str:
+    """
+    Pick the model file to load for the configured precision.
+    
+    With precision "auto", an already downloaded quantized variant of
+    the model (ggml-<name>-q5_0.bin etc.) is used instead of the full
+    one: it moves far fewer bytes per weight at nearly the same accuracy.
+    Returns a file path for such a variant, otherwise the model name.
+    """
+    if get_config().precision != 'auto' or _is_quantized(model_name):
+        return model_name
+    
+    models_dir = get_models_dir()
+    for quant in GGML_QUANTIZATIONS:
+        path = os.path.join(models_dir, f'ggml-{model_name}-{quant}.bin')
+        if os.path.isfile(path):
+            return path
+    return model_name
+
+
+@lru_cache(maxsize=None)
+def _whispercpp_isa() -> Optional[str]:
+    """
+    Get the best SIMD instruction set the installed whisper.cpp was built
+    with, from its system_info line ("AVX = 1 | AVX2 = 0 | ..."). Returns
+    'generic' for a build without any, or None if it can't be told.
+    """
+    try:
+        info = Model.system_info()
+    except Exception:
+        return None
+    if not isinstance(info, str):
+        return None
+    
+    enabled = set()
+    for item in info.split('|'):
+        name, _, value = item.partition('=')
+        # Some fields carry a group prefix ("CPU : SSE3 = 1")
+        if value.strip() == '1' and name.split():
+            enabled.add(name.split()[-1].lower())
+    return next((isa for isa in CPU_ISAS if isa in enabled), 'generic')
+
+
+def _quantize_tool() -> Optional[str]:
+    """Find whisper.cpp's quantize tool on PATH."""
+    for name in QUANTIZE_TOOLS:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _quantize_model(model_name: str, quant: str) -> str:
+    """
+    Write a quantized copy of a downloaded ggml model.
+    
+    Runs whisper.cpp's quantize tool on ggml-<name>.bin and stores the
+    result next to it as ggml-<name>-<quant>.bin, where _resolve_model()
+    picks it up. Returns the new file's path.
+    
+    Raises:
+        RuntimeError: If the tool or the source model is missing, or
+            quantization fails
+    """
+    tool = _quantize_tool()
+    if tool is None:
+        raise RuntimeError("whisper.cpp quantize tool not found on PATH")
+    
+    models_dir = get_models_dir()
+    source = os.path.join(models_dir, f'ggml-{model_name}.bin')
+    target = os.path.join(models_dir, f'ggml-{model_name}-{quant}.bin')
+    if not os.path.isfile(source):
+        raise RuntimeError(f"Model '{model_name}' is not downloaded")
+    
+    # Write under a temporary name so a failed run never leaves a
+    # truncated file that _resolve_model() would prefer
+    partial = target + '.part'
+    try:
+        result = subprocess.run(
+            [tool, source, partial, quant],
+            capture_output=True, text=True, timeout=3600
+        )
+        if result.returncode != 0 or not os.path.isfile(partial):
+            raise RuntimeError(
+                f"Quantizing '{model_name}' failed: {result.stderr.strip()[-200:]}"
+            )
+        os.replace(partial, target)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"Quantizing '{model_name}' failed: {e}") from e
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return target
+
+
+def _new_model(model_name: str, use_gpu: bool) -> Model:
+    """Construct a pywhispercpp Model on the requested device."""
+    model = _resolve_model(model_name)
+    try:
+        return Model(
+            model,
+            models_dir=get_models_dir(),
+            context_params={'use_gpu': use_gpu}
+        )
+    except (TypeError, AttributeError):
+        # pywhispercpp without context_params: the build decides the device
+        return Model(model, models_dir=get_models_dir())
+
+
+def _load_model(model_name: str, use_gpu: bool = True) -> Model:
+    """
+    Load a whisper model (will download if not present).
+    
+    With use_gpu, whisper.cpp offloads inference to the GPU when the
+    installed build supports one. If the GPU load fails, the model is
+    loaded on the CPU instead.
+    """
+    try:
+        return _new_model(model_name, use_gpu)
+    except Exception as e:
+        if use_gpu:
+            try:
+                return _new_model(model_name, False)
+            except Exception:
+                pass
+        raise RuntimeError(f"Failed to load model '{model_name}': {str(e)}") from e
+
+
+def _release_memory():
+    """Free the native (and CUDA) memory of models that were just dropped."""
+    # pywhispercpp frees the whisper.cpp context when the Model is collected
+    gc.collect()
+    # Only if something already imported torch (diarization, VAD)
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _faster_whisper_name(model_name: str) -> str:
+    """Map a ggml model name to the matching faster-whisper model."""
+    # ggml quantization suffixes (q5_0, q8_0) have no CTranslate2 file;
+    # faster-whisper quantizes through compute_type instead
+    if _is_quantized(model_name):
+        return model_name.rpartition('-')[0]
+    return model_name
+
+
+def _faster_whisper_compute_type(device: str) -> str:
+    """Get the compute type for the precision setting on a device."""
+    precision = get_config().precision
+    if device == 'cuda':
+        return CUDA_COMPUTE_TYPES.get(precision, 'float16')
+    return CPU_COMPUTE_TYPES.get(precision, 'int8')
+
+
+def _pick_backend(device: str) -> str:
+    """
+    Get the backend a job without a preloaded whisper.cpp model runs on:
+    'openvino', 'faster-whisper' or 'whispercpp', per the backend setting
+    and what is installed.
+    """
+    backend = get_config().backend
+    if backend == 'openvino':
+        return 'openvino'
+    if backend == 'auto' and WhisperModel is not None and device in FASTER_WHISPER_DEVICES:
+        return 'faster-whisper'
+    return 'whispercpp'
+
+
+def _load_faster_whisper(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    n_threads: int
+) -> "WhisperModel":
+    """Load a faster-whisper model (downloading it if not present)."""
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=n_threads,
+        download_root=os.path.join(get_models_dir(), 'faster-whisper')
+    )
+
+
+def _transcribe_faster_whisper(
+    audio: Audio,
+    model_name: str,
+    language: str,
+    translate: bool,
+    n_threads: int,
+    device: str,
+    on_progress: Callable[[int, str], None],
+    cancelled: threading.Event,
+    on_segment: Optional[Callable[[Segment], None]] = None,
+    load_model: Callable[[str, str, str, int], "WhisperModel"] = _load_faster_whisper
+) -> Optional[List[Segment]]:
+    """
+    Transcribe with faster-whisper (CTranslate2) on CUDA or CPU.
+    
+    On CUDA the batched pipeline is used; on CPU the model runs with int8
+    weights (per the precision setting) and skips silence with its VAD
+    filter. The model comes from load_model (by default loaded for this
+    job only). Returns the segments (possibly incomplete if cancelled), or
+    None if the backend could not be used so the caller can fall back to
+    pywhispercpp.
+    """
+    on_cuda = device == 'cuda'
+    on_progress(10, f"Loading model on {'CUDA' if on_cuda else 'CPU'}...")
+    try:
+        model = load_model(
+            _faster_whisper_name(model_name), device,
+            _faster_whisper_compute_type(device), n_threads
+        )
+        
+        if cancelled.is_set():
+            return []
+        
+        on_progress(20, "Transcribing audio...")
+        options = {
+            'language': None if language == 'auto' else language,
+            'task': 'translate' if translate else 'transcribe'
+        }
+        if on_cuda:
+            pipeline = BatchedInferencePipeline(model=model)
+            segments_raw, info = pipeline.transcribe(
+                audio, batch_size=FASTER_WHISPER_BATCH_SIZE, **options
+            )
+        else:
+            segments_raw, info = model.transcribe(
+                audio, vad_filter=get_config().vad_filter, **options
+            )
+        
+        # Segments are decoded lazily while iterating (times in seconds)
+        segments = []
+        for seg in segments_raw:
+            segment = Segment(seg.start, seg.end, seg.text)
+            segments.append(segment)
+            if on_segment is not None:
+                on_segment(segment)
+            if cancelled.is_set():
+                break
+            if info.duration:
+                progress = 20 + int(70 * min(seg.end / info.duration, 1.0))
+                on_progress(progress, "Transcribing audio...")
+        return segments
+    except Exception as e:
+        on_progress(10, f"faster-whisper unavailable ({str(e)[:30]}), using whisper.cpp...")
+        return None
+
+
+def _export_openvino(model_name: str) -> str:
+    """
+    Get the directory of the int8 OpenVINO export of a model.
+    
+    The model is exported from Hugging Face with optimum-cli the first
+    time it is used. Raises RuntimeError if the export fails.
+    """
+    name = _faster_whisper_name(model_name)
+    target = os.path.join(get_models_dir(), 'openvino', f'{name}-int8')
+    if os.path.isfile(os.path.join(target, 'openvino_encoder_model.xml')):
+        return target
+    
+    if not shutil.which('optimum-cli'):
+        raise RuntimeError("optimum-cli not found")
+    try:
+        result = subprocess.run([
+            'optimum-cli', 'export', 'openvino',
+            '-m', f'openai/whisper-{name}',
+            '--weight-format', 'int8',
+            target
+        ], capture_output=True, text=True, timeout=3600)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        raise RuntimeError(f"OpenVINO export failed: {e}") from e
+    if result.returncode != 0:
+        raise RuntimeError(f"OpenVINO export failed: {result.stderr.strip()[-200:]}")
+    return target
+
+
+def _transcribe_openvino(
+    audio: Audio,
+    model_name: str,
+    language: str,
+    translate: bool,
+    on_progress: Callable[[int, str], None],
+    cancelled: threading.Event,
+    on_segment: Optional[Callable[[Segment], None]] = None
+) -> Optional[List[Segment]]:
+    """
+    Transcribe with an int8 OpenVINO export of the model on the CPU.
+    
+    Returns the segments, or None if the backend could not be used so the
+    caller can fall back to pywhispercpp.
+    """
+    global _openvino_pipeline
+    try:
+        samples = audio
+        if isinstance(samples, str):
+            samples = _decode_audio(samples)
+            if samples is None:
+                samples = _decode_with_ffmpeg(audio)
+            if samples is None:
+                raise RuntimeError("could not decode audio")
+        
+        with _openvino_lock:
+            loaded_name, pipe = _openvino_pipeline
+            if loaded_name != _faster_whisper_name(model_name):
+                from optimum.intel import OVModelForSpeechSeq2Seq
+                from transformers import AutoProcessor, pipeline
+                
+                on_progress(10, "Loading OpenVINO model (exporting if needed)...")
+                model_dir = _export_openvino(model_name)
+                processor = AutoProcessor.from_pretrained(model_dir)
+                pipe = pipeline(
+                    'automatic-speech-recognition',
+                    model=OVModelForSpeechSeq2Seq.from_pretrained(model_dir),
+                    tokenizer=processor.tokenizer,
+                    feature_extractor=processor.feature_extractor,
+                    chunk_length_s=OPENVINO_CHUNK_LENGTH
+                )
+                _openvino_pipeline = (_faster_whisper_name(model_name), pipe)
+            
+            if cancelled.is_set():
+                return []
+            
+            on_progress(20, "Transcribing audio...")
+            generate_kwargs = {'task': 'translate' if translate else 'transcribe'}
+            if language != 'auto':
+                generate_kwargs['language'] = language
+            output = pipe(
+                {'raw': samples, 'sampling_rate': WHISPER_SAMPLE_RATE},
+                return_timestamps=True,
+                generate_kwargs=generate_kwargs
+            )
+    except Exception as e:
+        on_progress(10, f"OpenVINO unavailable ({str(e)[:30]}), using whisper.cpp...")
+        return None
+    
+    # The last chunk may have no end time; it runs to the end of the audio
+    duration = len(samples) / WHISPER_SAMPLE_RATE
+    segments = []
+    for chunk in output.get('chunks', []):
+        start, end = chunk['timestamp']
+        segment = Segment(start or 0.0, end if end is not None else duration, chunk['text'])
+        segments.append(segment)
+        if on_segment is not None:
+            on_segment(segment)
+    return segments
+
+
+@lru_cache(maxsize=None)
+def _supports_abort_callback() -> bool:
+    """Check whether the installed pywhispercpp accepts an abort_callback."""
+    try:
+        if 'abort_callback' in inspect.signature(Model.transcribe).parameters:
+            return True
+    except (TypeError, ValueError):
+        pass
+    # Older releases take whisper params as **kwargs, validated against
+    # PARAMS_SCHEMA
+    try:
+        from pywhispercpp.constants import PARAMS_SCHEMA
+    except ImportError:
+        return False
+    return 'abort_callback' in PARAMS_SCHEMA
+
+
+def _transcribe_whispercpp(
+    audio: Audio,
+    model_name: str,
+    language: str,
+    translate: bool,
+    n_threads: int,
+    on_progress: Callable[[int, str], None],
+    cancelled: threading.Event,
+    model: Optional[Model],
+    device: str,
+    load_model: Callable[[str, bool], Model],
+    on_segment: Optional[Callable[[Segment], None]] = None
+) -> List[Segment]:
+    """Transcribe with pywhispercpp, loading the model if not given."""
+    if model is None:
+        on_progress(10, "Loading model (downloading if needed)...")
+        model = load_model(model_name, device != 'cpu')
+        
+        if cancelled.is_set():
+            return []
+    
+    on_progress(15, "Preparing transcription...")
+    
+    # Use thread count from settings
+    params = {
+        'n_threads': n_threads,
+    }
+    
+    # Set language if not auto-detect
+    if language != 'auto':
+        params['language'] = language
+    
+    # Enable translation if requested
+    if translate:
+        params['translate'] = True
+    
+    # Drop silent stretches so the encoder only runs over speech
+    offsets = None
+    if get_config().vad_filter and get_speech_timestamps is not None:
+        on_progress(17, "Detecting speech...")
+        samples = audio
+        if isinstance(samples, str):
+            samples = _decode_audio(samples)
+            if samples is None:
+                samples = _decode_with_ffmpeg(audio)
+        speech = _speech_only(samples) if samples is not None else None
+        if speech is not None:
+            audio, offsets = speech
+    
+    if cancelled.is_set():
+        return []
+    
+    # Hand each segment over as soon as whisper.cpp decodes it
+    if on_segment is not None:
+        def new_segment(seg):
+            segment = Segment(seg.t0 / 100.0, seg.t1 / 100.0, seg.text)
+            if offsets:
+                _restore_times([segment], offsets)
+            on_segment(segment)
+        params['new_segment_callback'] = new_segment
+    
+    # whisper.cpp polls abort_callback between decoder steps, so a cancel
+    # stops it mid-file instead of after it (without it, cancel waits for
+    # the decode)
+    if _supports_abort_callback():
+        params['abort_callback'] = lambda *_: cancelled.is_set()
+    
+    on_progress(20, "Transcribing audio...")
+    segments_raw = model.transcribe(audio, **params)
+    
+    # Convert to our Segment format
+    # pywhispercpp returns t0/t1 in centiseconds (1/100th of a second)
+    segments = [Segment(seg.t0 / 100.0, seg.t1 / 100.0, seg.text) for seg in segments_raw]
+    if offsets:
+        _restore_times(segments, offsets)
+    return segments
+
+
+def _transcribe_file(
+    filepath: str,
+    model_name: str,
+    language: str,
+    translate: bool,
+    n_threads: int,
+    enable_diarization: bool,
+    num_speakers: Optional[int],
+    on_progress: Callable[[int, str], None],
+    cancelled: threading.Event,
+    model: Optional[Model] = None,
+    device: str = 'cpu',
+    load_model: Callable[[str, bool], Model] = _load_model,
+    on_segment: Optional[Callable[[Segment], None]] = None,
+    load_faster_whisper: Callable[[str, str, str, int], "WhisperModel"] = _load_faster_whisper,
+    on_segments_reset: Optional[Callable[[], None]] = None
+) -> Optional[TranscriptionResult]:
+    """
+    Run a transcription job in the calling thread.
+    
+    device is the GPU type to use ('cuda', 'rocm', 'metal') or 'cpu'.
+    on_segment, if given, receives each segment as it is decoded (before
+    speaker labels are added). on_segments_reset is called when the
+    segments streamed so far are void because a backend failed midway
+    and whisper.cpp starts over.
+    Without a preloaded model, faster-whisper is used on CUDA and CPU when
+    it is installed, or OpenVINO when the backend setting asks for it
+    (whisper.cpp when it says so); otherwise the whisper.cpp model comes
+    from load_model. faster-whisper models come from load_faster_whisper.
+    Both load for this job only by default.
+    Returns the TranscriptionResult, or None if cancelled.
+    Raises RuntimeError (or the underlying exception) on failure.
+    """
+    temp_wav_path = None
+    diarization_pool = None
+    try:
+        # Check if file exists
+        if not os.path.isfile(filepath):
+            raise RuntimeError(f"File not found: {filepath}")
+        
+        # Check if we need to convert the file
+        file_ext = os.path.splitext(filepath)[1].lower()
+        audio = filepath
+        
+        if file_ext in FORMATS_NEEDING_CONVERSION:
+            on_progress(5, "Converting audio format...")
+            # Decode straight to samples in memory (PyAV, else FFmpeg through
+            # a pipe); a temporary WAV is only written when numpy is missing
+            samples = _decode_audio(filepath)
+            if samples is None:
+                samples = _decode_with_ffmpeg(filepath)
+            if samples is None:
+                temp_wav_path = _convert_to_wav(filepath)
+            
+            if samples is not None:
+                audio = samples
+            elif temp_wav_path:
+                audio = temp_wav_path
+            else:
+                # FFmpeg not available or conversion failed, try direct if possible
+                on_progress(5, "Conversion failed or FFmpeg not found. Trying direct transcription (may fail)...")
+        elif file_ext == '.wav':
+            # pywhispercpp spawns FFmpeg to read any path it is given, so
+            # WAVs are read here: directly when already in Whisper's format,
+            # otherwise through PyAV
+            samples = _read_pcm_wav(filepath)
+            if samples is None:
+                samples = _decode_audio(filepath)
+            if samples is not None:
+                audio = samples
+        
+        if cancelled.is_set():
+            return None
+        
+        # Diarization shares nothing with transcription but the audio, so
+        # it runs alongside it and is usually done by the time ASR is
+        diarization = None
+        if enable_diarization:
+            diarization_pool = ThreadPoolExecutor(max_workers=1)
+            diarization = diarization_pool.submit(_diarize, audio, num_speakers)
+        
+        # Note whether the first-choice backend streamed anything before
+        # it gave up
+        streamed = False
+        stream = on_segment
+        if on_segment is not None:
+            def stream(segment: Segment):
+                nonlocal streamed
+                streamed = True
+                on_segment(segment)
+        
+        segments = None
+        backend = _pick_backend(device) if model is None else 'whispercpp'
+        if backend == 'openvino':
+            segments = _transcribe_openvino(
+                audio, model_name, language, translate,
+                on_progress, cancelled, stream
+            )
+        elif backend == 'faster-whisper':
+            segments = _transcribe_faster_whisper(
+                audio, model_name, language, translate, n_threads, device,
+                on_progress, cancelled, stream, load_faster_whisper
+            )
+        
+        if segments is None:
+            if streamed and on_segments_reset is not None:
+                on_segments_reset()
+            segments = _transcribe_whispercpp(
+                audio, model_name, language, translate, n_threads,
+                on_progress, cancelled, model, device, load_model, on_segment
+            )
+        
+        if cancelled.is_set():
+            return None
+        
+        on_progress(90, "Processing results...")
+        
+        # Merge speaker labels once diarization is done
+        if diarization is not None:
+            segments = _add_speaker_labels(segments, diarization, on_progress)
+        
+        if not segments:
+            raise RuntimeError("No speech detected in the audio file.")
+        
+        # Calculate total duration (segments is guaranteed non-empty here)
+        duration = segments[-1].end
+        
+        on_progress(100, "Complete!")
+        
+        return TranscriptionResult(
+            segments=segments,
+            language=language if language != 'auto' else 'detected',
+            duration=duration
+        )
+    finally:
+        # Don't wait on diarization of a cancelled or failed job
+        if diarization_pool is not None:
+            diarization_pool.shutdown(wait=False, cancel_futures=True)
+        
+        # Clean up temporary WAV file
+        if temp_wav_path and os.path.exists(temp_wav_path):
+            try:
+                os.remove(temp_wav_path)
+            except:
+                pass
+
+
+def _diarize(audio: Audio, num_speakers: Optional[int]):
+    """
+    Run speaker diarization on the job's audio.
+    Returns the DiarizationResult, or None if diarization is not available.
+    """
+    from diarizer import Diarizer
+    
+    diarizer = Diarizer()
+    if not diarizer.is_available():
+        return None
+    return diarizer.diarize(audio, num_speakers=num_speakers)
+
+
+def _add_speaker_labels(
+    segments: List[Segment],
+    diarization: Future,
+    on_progress: Callable[[int, str], None]
+) -> List[Segment]:
+    """Add speaker labels to segments from a running _diarize() job."""
+    try:
+        on_progress(90, "Identifying speakers...")
+        
+        diarization = diarization.result()
+        if diarization is None:
+            on_progress(90, "Diarization not available, skipping...")
+            return segments
+        
+        # Merge speaker labels with segments
+        speakers = diarization.get_speakers_for(
+            [seg.start for seg in segments],
+            [seg.end for seg in segments]
+        )
+        for seg, speaker in zip(segments, speakers):
+            seg.speaker = speaker
+        
+        on_progress(95, f"Found {diarization.num_speakers} speakers")
+        return segments
+        
+    except Exception as e:
+        on_progress(90, f"Diarization error: {str(e)[:30]}...")
+        return segments  # Return original segments without speaker labels
+
+
+class TranscriptionJob(QObject):
+    """A transcription request queued on a TranscriptionWorker."""
     
     # Signals
     progress = pyqtSignal(int, str)  # (percentage, status message)
+    segment_ready = pyqtSignal(int, object)  # (job id, Segment) as soon as it is decoded
+    segments_reset = pyqtSignal(int)  # job id; segments sent so far are void
     finished = pyqtSignal(object)     # TranscriptionResult or None
     error = pyqtSignal(str)           # Error message
     
+    _ids = itertools.count(1)
+    
     def __init__(
         self,
         filepath: str,
@@ -92,9 +965,13 @@ class TranscriptionWorker(QThread):
         n_threads: int = 4,
         enable_diarization: bool = False,
         num_speakers: Optional[int] = None,
+        device: str = 'cpu',
+        load_model: Callable[[str, bool], Model] = _load_model,
+        load_faster_whisper: Callable[[str, str, str, int], "WhisperModel"] = _load_faster_whisper,
         parent: Optional[QObject] = None
     ):
         super().__init__(parent)
+        self.job_id = next(TranscriptionJob._ids)
         self.filepath = filepath
         self.model_name = model_name
         self.language = language
@@ -102,167 +979,217 @@ class TranscriptionWorker(QThread):
         self.n_threads = n_threads
         self.enable_diarization = enable_diarization
         self.num_speakers = num_speakers
+        self.device = device
+        self.load_model = load_model
+        self.load_faster_whisper = load_faster_whisper
         self._cancelled = threading.Event()
+        self._done = threading.Event()
     
     def cancel(self):
         """Request cancellation of the transcription."""
         self._cancelled.set()
     
+    def is_done(self) -> bool:
+        """Check if the job has finished, failed, or been cancelled."""
+        return self._done.is_set()
+    
+    def wait(self):
+        """Block until the worker is done with this job."""
+        self._done.wait()
+    
     def run(self):
-        """Run the transcription in a separate thread."""
-        temp_wav_path = None
+        """Run the transcription in the calling (worker) thread."""
         try:
-            # Check if file exists
-            if not os.path.isfile(self.filepath):
-                self.error.emit(f"File not found: {self.filepath}")
-                return
-            
-            # Check if we need to convert the file
-            file_ext = os.path.splitext(self.filepath)[1].lower()
-            audio_path = self.filepath
-            
-            if file_ext in FORMATS_NEEDING_CONVERSION:
-                self.progress.emit(5, "Converting audio format...")
-                temp_wav_path = _convert_to_wav(self.filepath)
-                if temp_wav_path:
-                    audio_path = temp_wav_path
-                else:
-                    # FFmpeg not available or conversion failed, try direct if possible
-                    self.progress.emit(5, "Conversion failed or FFmpeg not found. Trying direct transcription (may fail)...")
-            
-            if self._cancelled.is_set():
-                return
-            
-            self.progress.emit(10, "Loading model (downloading if needed)...")
-            
-            # Load the model (will download if not present)
-            models_dir = get_models_dir()
-            try:
-                model = Model(self.model_name, models_dir=models_dir)
-            except Exception as e:
-                self.error.emit(f"Failed to load model '{self.model_name}': {str(e)}")
-                return
-            
             if self._cancelled.is_set():
                 return
-            
-            self.progress.emit(15, "Preparing transcription...")
-            
-            # Use thread count from settings
-            params = {
-                'n_threads': self.n_threads,
-            }
-            
-            # Set language if not auto-detect
-            if self.language != 'auto':
-                params['language'] = self.language
-            
-            # Enable translation if requested
-            if self.translate:
-                params['translate'] = True
-            
-            if self._cancelled.is_set():
-                return
-            
-            # Run transcription
-            self.progress.emit(20, "Transcribing audio...")
-            segments_raw = model.transcribe(audio_path, **params)
-            
-            if self._cancelled.is_set():
-                return
-            
-            self.progress.emit(90, "Processing results...")
-            
-            # Convert to our Segment format
-            # pywhispercpp returns t0/t1 in centiseconds (1/100th of a second)
-            segments = []
-            for seg in segments_raw:
-                segments.append(Segment(
-                    start=seg.t0 / 100.0,  # Convert from centiseconds to seconds
-                    end=seg.t1 / 100.0,
-                    text=seg.text,
-                    speaker=None
-                ))
-            
-            # Run diarization if enabled
-            if self.enable_diarization and not self._cancelled.is_set():
-                segments = self._add_speaker_labels(segments, audio_path)
-            
-            if not segments:
-                self.error.emit("No speech detected in the audio file.")
-                return
-            
-            # Calculate total duration (segments is guaranteed non-empty here)
-            duration = segments[-1].end
-            
-            # Create result
-            result = TranscriptionResult(
-                segments=segments,
-                language=self.language if self.language != 'auto' else 'detected',
-                duration=duration
+            result = _transcribe_file(
+                filepath=self.filepath,
+                model_name=self.model_name,
+                language=self.language,
+                translate=self.translate,
+                n_threads=self.n_threads,
+                enable_diarization=self.enable_diarization,
+                num_speakers=self.num_speakers,
+                on_progress=throttle_progress(self.progress.emit),
+                cancelled=self._cancelled,
+                device=self.device,
+                load_model=self.load_model,
+                on_segment=lambda segment: self.segment_ready.emit(self.job_id, segment),
+                load_faster_whisper=self.load_faster_whisper,
+                on_segments_reset=lambda: self.segments_reset.emit(self.job_id)
             )
-            
-            self.progress.emit(100, "Complete!")
-            self.finished.emit(result)
-            
         except Exception as e:
+            # whisper.cpp raises when abort_callback stops a decode; that
+            # is a cancel, not a failure
+            if self._cancelled.is_set():
+                return
             error_msg = str(e)
             if 'CUDA' in error_msg or 'cuda' in error_msg:
                 error_msg += "\n\nTip: Try selecting CPU mode in settings."
             self.error.emit(error_msg)
+            return
         finally:
-            # Clean up temporary WAV file
-            if temp_wav_path and os.path.exists(temp_wav_path):
-                try:
-                    os.remove(temp_wav_path)
-                except:
-                    pass
+            self._done.set()
+        
+        if result is not None:
+            self.finished.emit(result)
+
+
+class TranscriptionWorker(QThread):
+    """
+    Long-lived worker thread running queued transcription jobs in order.
     
-    def _add_speaker_labels(self, segments: List[Segment], audio_path: str) -> List[Segment]:
-        """Add speaker labels to segments using diarization."""
-        try:
-            from diarizer import Diarizer
-            
-            self.progress.emit(85, "Identifying speakers...")
-            
-            diarizer = Diarizer()
-            if not diarizer.is_available():
-                self.progress.emit(90, "Diarization not available, skipping...")
-                return segments
-            
-            # Run diarization
-            diarization = diarizer.diarize(
-                audio_path,
-                num_speakers=self.num_speakers,
-                on_progress=lambda p, m: self.progress.emit(85 + int(p * 0.1), m)
-            )
-            
-            # Merge speaker labels with segments
-            for seg in segments:
-                midpoint = (seg.start + seg.end) / 2
-                speaker = diarization.get_speaker_at(midpoint)
-                if speaker is None:
-                    speaker = diarization.get_speaker_at(seg.start)
-                seg.speaker = speaker
-            
-            self.progress.emit(95, f"Found {diarization.num_speakers} speakers")
-            return segments
-            
-        except Exception as e:
-            self.progress.emit(90, f"Diarization error: {str(e)[:30]}...")
-            return segments  # Return original segments without speaker labels
+    One thread serves every job of a Transcriber, so starting a job
+    costs a queue put rather than a thread start.
+    """
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._queue: "queue.Queue[Optional[TranscriptionJob]]" = queue.Queue()
+    
+    def submit(self, job: TranscriptionJob):
+        """Queue a job; it runs once the jobs before it are done."""
+        self._queue.put(job)
+    
+    def stop(self):
+        """Let the thread exit once the queued jobs are done."""
+        self._queue.put(None)
+    
+    def run(self):
+        """Run queued jobs until stop() is called."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.run()
 
 
 class Transcriber:
     """High-level transcription manager."""
     
-    def __init__(self):
-        self.current_worker: Optional[TranscriptionWorker] = None
-        self.gpu_type, self.gpu_name = detect_gpu()
+    def __init__(self, gpu: Optional[Tuple[str, str]] = None):
+        """
+        Args:
+            gpu: (gpu_type, description) as returned by detect_gpu(), to
+                skip detecting it again; detected when None
+        """
+        self.current_job: Optional[TranscriptionJob] = None
+        self._worker: Optional[TranscriptionWorker] = None
+        self.gpu_type, self.gpu_name = gpu if gpu is not None else detect_gpu()
+        # SIMD instruction sets of the CPU and of the whisper.cpp build
+        self.cpu_isa = detect_isa()
+        self.build_isa = _whispercpp_isa()
+        self._sync_cancelled = threading.Event()
+        # Set by load_model(); _model stays None when the configured
+        # backend is faster-whisper or OpenVINO
+        self._model: Optional[Model] = None
+        self._model_name: Optional[str] = None
+        self._device = 'cpu'
+        self._n_threads = 4
+        # Most recently used last. whisper.cpp models are keyed by
+        # (model file or name, use_gpu), faster-whisper ones by
+        # ('faster-whisper', name, device, compute_type)
+        self._models: OrderedDict[tuple, object] = OrderedDict()
+        self._models_lock = threading.Lock()
+        # Models (file or name) whisper.cpp failed to load on the GPU
+        self._cpu_only: set[str] = set()
+        # (monotonic expiry, model names) from get_available_models()
+        self._available_models: Tuple[float, List[str]] = (0.0, [])
+    
+    def _cached_model(self, key: tuple, load: Callable[[], object]):
+        """
+        Get the model cached under key, or load() and cache it.
+        
+        Keeps the MODEL_CACHE_SIZE most recently used models. If load()
+        fails while other models are cached, they are dropped and load()
+        is retried once. The caller must hold _models_lock.
+        """
+        model = self._models.get(key)
+        if model is not None:
+            self._models.move_to_end(key)
+            return model
+        
+        # Evict before loading, so the old weights are freed before the
+        # new ones take memory rather than after
+        if len(self._models) >= MODEL_CACHE_SIZE:
+            self._models.popitem(last=False)
+            _release_memory()
+        
+        try:
+            model = load()
+        except Exception:
+            if not self._models:
+                raise
+            # Likely out of (V)RAM: drop every cached model and retry once
+            self._models.clear()
+            _release_memory()
+            model = load()
+        
+        self._models[key] = model
+        return model
+    
+    def _get_model(self, model_name: str, use_gpu: bool) -> Model:
+        """
+        Get a loaded whisper.cpp model, reusing one from an earlier job
+        if possible.
+        
+        A model that can't be loaded on the GPU, even with the cache
+        emptied, is loaded on the CPU. If the CPU load then works, the
+        model stays on the CPU for later jobs (until unload_model()).
+        The cache key records the device actually used. Raises
+        RuntimeError if the model fails to load.
+        """
+        resolved = _resolve_model(model_name)
+        with self._models_lock:
+            gpu_failed = False
+            if use_gpu and resolved not in self._cpu_only:
+                try:
+                    return self._cached_model(
+                        (resolved, True), lambda: _new_model(model_name, True)
+                    )
+                except Exception:
+                    gpu_failed = True
+            
+            try:
+                model = self._cached_model(
+                    (resolved, False), lambda: _new_model(model_name, False)
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to load model '{model_name}': {str(e)}") from e
+            
+            # The model itself is fine (a failed download would have failed
+            # here too), so it is the GPU that can't take it
+            if gpu_failed:
+                self._cpu_only.add(resolved)
+            return model
+    
+    def _get_faster_whisper_model(
+        self,
+        model_name: str,
+        device: str,
+        compute_type: str,
+        n_threads: int
+    ) -> "WhisperModel":
+        """
+        Get a loaded faster-whisper model, reusing one from an earlier job
+        if possible.
+        
+        A cached model keeps the CPU thread count it was loaded with.
+        """
+        key = ('faster-whisper', model_name, device, compute_type)
+        with self._models_lock:
+            return self._cached_model(
+                key,
+                lambda: _load_faster_whisper(model_name, device, compute_type, n_threads)
+            )
+    
+    def _is_current_job(self, job_id: int) -> bool:
+        """Check whether job_id belongs to the most recently started job."""
+        return self.current_job is not None and self.current_job.job_id == job_id
     
     def is_busy(self) -> bool:
         """Check if a transcription is in progress."""
-        return self.current_worker is not None and self.current_worker.isRunning()
+        return self.current_job is not None and not self.current_job.is_done()
     
     def transcribe(
         self,
@@ -275,11 +1202,24 @@ class Transcriber:
         num_speakers: Optional[int] = None,
         on_progress: Optional[Callable[[int, str], None]] = None,
         on_finished: Optional[Callable[[TranscriptionResult], None]] = None,
-        on_error: Optional[Callable[[str], None]] = None
-    ) -> TranscriptionWorker:
+        on_error: Optional[Callable[[str], None]] = None,
+        use_gpu: bool = True,
+        on_segment: Optional[Callable[[Segment], None]] = None,
+        on_segments_reset: Optional[Callable[[], None]] = None
+    ) -> TranscriptionJob:
         """
         Start a transcription job.
         
+        Returns immediately: decoding, model loading and inference all run
+        on the persistent TranscriptionWorker thread, and the callbacks are
+        delivered back through queued signals.
+        
+        Threading contract: the native inference call (whisper_full in
+        pywhispercpp) must release the GIL while it runs, and re-acquire it
+        only to invoke Python callbacks. Progress signals from this worker
+        and concurrent batch jobs (see BatchWorker) rely on this; a backend
+        that holds the GIL serializes them and stalls the Qt event loop.
+        
         Args:
             filepath: Path to the audio/video file
             model_name: Whisper model name (tiny, base, small, medium, large, turbo)
@@ -291,51 +1231,211 @@ class Transcriber:
             on_progress: Callback for progress updates (percentage, message)
             on_finished: Callback when transcription completes
             on_error: Callback for errors
+            use_gpu: Run on the GPU if one is detected (False forces CPU)
+            on_segment: Callback for each segment as it is decoded. Only
+                segments of the current job are passed on, so a cancelled
+                job's late segments are dropped
+            on_segments_reset: Callback when the segments passed to
+                on_segment so far are void (decoding restarts on another
+                backend)
         
         Returns:
-            The worker thread for additional control
+            The queued job for additional control
         """
         # Cancel any existing job
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.cancel()
-            self.current_worker.wait()
+        self.cancel()
         
-        # Create new worker
-        worker = TranscriptionWorker(
+        job = TranscriptionJob(
             filepath=filepath,
             model_name=model_name,
             language=language,
             translate=translate,
             n_threads=n_threads,
             enable_diarization=enable_diarization,
-            num_speakers=num_speakers
+            num_speakers=num_speakers,
+            device=self.gpu_type if use_gpu else 'cpu',
+            load_model=self._get_model,
+            load_faster_whisper=self._get_faster_whisper_model
         )
         
-        # Connect signals
+        # Connect signals. Queued explicitly so the callbacks always run on
+        # the calling (GUI) thread, even when they are plain functions.
+        queued = Qt.ConnectionType.QueuedConnection
         if on_progress:
-            worker.progress.connect(on_progress)
+            job.progress.connect(on_progress, queued)
+        if on_segment:
+            def segment_ready(job_id: int, segment: Segment):
+                if self._is_current_job(job_id):
+                    on_segment(segment)
+            job.segment_ready.connect(segment_ready, queued)
+        if on_segments_reset:
+            def segments_reset(job_id: int):
+                if self._is_current_job(job_id):
+                    on_segments_reset()
+            job.segments_reset.connect(segments_reset, queued)
         if on_finished:
-            worker.finished.connect(on_finished)
+            job.finished.connect(on_finished, queued)
         if on_error:
-            worker.error.connect(on_error)
+            job.error.connect(on_error, queued)
         
-        self.current_worker = worker
-        worker.start()
+        # The worker thread is started once and kept for later jobs
+        if self._worker is None:
+            self._worker = TranscriptionWorker()
+            self._worker.start()
         
-        return worker
+        self.current_job = job
+        self._worker.submit(job)
+        
+        return job
+    
+    def load_model(self, model_name: str, n_threads: int = 4, use_gpu: bool = True) -> None:
+        """
+        Load a model once for use by transcribe_loaded().
+        
+        The model is loaded for the configured backend: a faster-whisper
+        or whisper.cpp model up front, the OpenVINO pipeline with the first
+        file. Models already loaded by this Transcriber (for an earlier
+        call or job) are reused.
+        
+        Raises:
+            RuntimeError: If the model fails to load
+        """
+        device = self.gpu_type if use_gpu else 'cpu'
+        self._n_threads = n_threads
+        self._model = None
+        backend = _pick_backend(device)
+        if backend == 'faster-whisper':
+            try:
+                self._get_faster_whisper_model(
+                    _faster_whisper_name(model_name), device,
+                    _faster_whisper_compute_type(device), n_threads
+                )
+            except Exception:
+                # Jobs fall back to whisper.cpp, as with transcribe()
+                backend = 'whispercpp'
+        if backend == 'whispercpp':
+            self._model = self._get_model(model_name, device != 'cpu')
+        self._model_name = model_name
+        self._device = device
+    
+    def unload_model(self) -> None:
+        """Release the model loaded by load_model() and any cached models."""
+        self._model = None
+        self._model_name = None
+        with self._models_lock:
+            self._models.clear()
+            self._cpu_only.clear()
+        _release_memory()
+    
+    def transcribe_loaded(
+        self,
+        filepath: str,
+        language: str = 'auto',
+        translate: bool = False,
+        enable_diarization: bool = False,
+        num_speakers: Optional[int] = None,
+        on_progress: Optional[Callable[[int, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Optional[TranscriptionResult]:
+        """
+        Transcribe a file with the model loaded by load_model().
+        
+        Runs in the calling thread, for callers already on a worker
+        thread, and skips the per-file model load. A Transcriber holding a
+        loaded model must not be used from several threads at once; pass
+        cancel_event to cancel the call without going through cancel().
+        
+        Raises:
+            RuntimeError: If no model is loaded, or transcription fails
+        """
+        if self._model_name is None:
+            raise RuntimeError("No model loaded. Call load_model() first.")
+        
+        if cancel_event is None:
+            self._sync_cancelled.clear()
+            cancel_event = self._sync_cancelled
+        
+        return _transcribe_file(
+            filepath=filepath,
+            model_name=self._model_name,
+            language=language,
+            translate=translate,
+            n_threads=self._n_threads,
+            enable_diarization=enable_diarization,
+            num_speakers=num_speakers,
+            on_progress=on_progress or (lambda pct, msg: None),
+            cancelled=cancel_event,
+            model=self._model,
+            device=self._device,
+            load_model=self._get_model,
+            load_faster_whisper=self._get_faster_whisper_model
+        )
     
     def cancel(self):
         """Cancel the current transcription job."""
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.cancel()
-            self.current_worker.wait()
+        self._sync_cancelled.set()
+        if self.current_job and not self.current_job.is_done():
+            self.current_job.cancel()
+            self.current_job.wait()
     
-    def get_available_models(self) -> List[str]:
-        """Get list of downloaded models."""
+    def shutdown(self):
+        """Cancel the current job and stop the worker thread."""
+        self.cancel()
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker.wait()
+            self._worker = None
+    
+    def can_quantize(self, model_name: str) -> bool:
+        """Check whether quantize_model() has work to do for a model."""
+        if _is_quantized(model_name) or _quantize_tool() is None:
+            return False
         models_dir = get_models_dir()
+        quant = get_config().model_quant
+        return (
+            os.path.isfile(os.path.join(models_dir, f'ggml-{model_name}.bin'))
+            and not os.path.isfile(os.path.join(models_dir, f'ggml-{model_name}-{quant}.bin'))
+        )
+    
+    def quantize_model(self, model_name: str) -> str:
+        """
+        Convert a downloaded model to the configured quantization.
+        
+        Blocks while whisper.cpp's quantize tool runs; call it from a
+        worker thread. With precision "auto", later jobs load the
+        quantized file instead of the full one.
+        
+        Raises:
+            RuntimeError: If quantization fails
+        """
+        path = _quantize_model(model_name, get_config().model_quant)
+        self._available_models = (0.0, [])
+        return path
+    
+    def get_available_models(self) -> List[str]:
+        """
+        Get list of downloaded models (at full or quantized precision).
+        
+        The listing is reused for AVAILABLE_MODELS_TTL seconds, so UI
+        polling doesn't rescan the models directory each time.
+        """
+        expires, cached = self._available_models
+        if time.monotonic() < expires:
+            return list(cached)
+        
+        try:
+            with os.scandir(get_models_dir()) as entries:
+                files = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return []
+        
         available = []
-        for model_name in ['tiny', 'base', 'small', 'medium', 'large', 'turbo']:
-            model_file = os.path.join(models_dir, f'ggml-{model_name}.bin')
-            if os.path.exists(model_file):
+        for model_name, _ in WHISPER_MODELS:
+            variants = [model_name]
+            if not _is_quantized(model_name):
+                variants += [f'{model_name}-{quant}' for quant in GGML_QUANTIZATIONS]
+            if any(f'ggml-{name}.bin' in files for name in variants):
                 available.append(model_name)
-        return available
+        
+        self._available_models = (time.monotonic() + AVAILABLE_MODELS_TTL, available)
+        return list(available)
@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QComboBox, QProgressBar, QFrame, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread
 from PyQt6.QtGui import QFont
 
 from text_processor import TextProcessor
@@ -64,6 +64,21 @@ class StatusIndicator(QWidget):
         return self._connected
 
 
+class ModelListWorker(QThread):
+    """Background worker listing downloaded models with the lms CLI."""
+    
+    finished = pyqtSignal(object, object)  # list of ModelInfo, current model or None
+    
+    def __init__(self, manager: LMStudioManager, refresh: bool):
+        super().__init__()
+        self.manager = manager
+        self.refresh = refresh
+    
+    def run(self):
+        models = self.manager.list_downloaded_models(refresh=self.refresh)
+        self.finished.emit(models, self.manager.get_current_model())
+
+
 class AIProcessingPanel(QWidget):
     """Panel with AI processing controls."""
     
@@ -80,6 +95,7 @@ class AIProcessingPanel(QWidget):
         self._processing = False
         self._has_transcription = False
         self.check_timer = None  # Initialize timer reference
+        self._models_worker: ModelListWorker | None = None
         self._setup_ui()
         self._start_connection_check()
         self._refresh_models()
@@ -88,6 +104,8 @@ class AIProcessingPanel(QWidget):
         """Stop timers and cleanup resources."""
         if self.check_timer:
             self.check_timer.stop()
+        if self._models_worker and self._models_worker.isRunning():
+            self._models_worker.wait()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -309,20 +327,35 @@ class AIProcessingPanel(QWidget):
         self.model_row.setVisible(cli_available and connected)
         self.start_server_btn.setVisible(cli_available and not connected)
         
+        # Pick up models downloaded outside the app once the list goes stale
+        if cli_available and connected and self._manager.is_models_cache_stale():
+            self._refresh_models()
+        
         # Update button states
         self._update_button_states()
     
     def _refresh_models(self):
-        """Refresh the model dropdown list."""
+        """Refresh the model dropdown list (the CLI runs on a worker thread)."""
         if not self._manager.is_cli_available():
             return
+        if self._models_worker and self._models_worker.isRunning():
+            return
+        
+        self._models_worker = ModelListWorker(
+            self._manager, refresh=self._manager.is_models_cache_stale()
+        )
+        self._models_worker.finished.connect(self._on_models_listed)
+        self._models_worker.start()
+    
+    def _on_models_listed(self, models, current_model):
+        """Fill the model dropdown from a finished ModelListWorker."""
+        # Nothing listed (CLI failure or no models): keep what is shown
+        if not models:
+            return
         
         self.model_combo.blockSignals(True)
         self.model_combo.clear()
         
-        models = self._manager.list_downloaded_models()
-        current_model = self._manager.get_current_model()
-        
         current_index = 0
         for i, model in enumerate(models):
             self.model_combo.addItem(model.display_name, model.path)
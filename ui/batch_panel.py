@@ -6,13 +6,13 @@ Widget for managing batch file queue
 import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QListWidget, QListWidgetItem, QProgressBar,
-    QFileDialog, QFrame, QAbstractItemView
+    QLabel, QListView, QFileDialog, QFrame,
+    QStyle, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter
 
-from batch_processor import BatchProcessor, BatchItem, BatchStatus
+from batch_processor import BatchProcessor, BatchStatus
 
 
 # ============================================================================
@@ -35,94 +35,201 @@ STATUS_ICONS = {
     BatchStatus.CANCELLED: "⚠️",
 }
 
+# (icon, name color) per status, looked up once per row paint
+STATUS_STYLES = {
+    status: (STATUS_ICONS[status], QColor(STATUS_COLORS[status]))
+    for status in BatchStatus
+}
+_UNKNOWN_STATUS_STYLE = ("?", QColor("#888888"))
+
+
+# Height of one queue row (pixels)
+ROW_HEIGHT = 28
+
+# Rows laid out per event loop pass in long queues
+LAYOUT_BATCH_SIZE = 32
+
+# Rows changed by item signals are repainted together this often (ms)
+REPAINT_INTERVAL_MS = 100
+
 
 # ============================================================================
-# BATCH ITEM WIDGET
+# BATCH LIST MODEL
 # ============================================================================
 
-class BatchItemWidget(QWidget):
-    """Widget representing a single batch item."""
+class BatchListModel(QAbstractListModel):
+    """
+    List model exposing a BatchProcessor's queue to a QListView.
     
-    remove_requested = pyqtSignal(int)
+    Queue changes go through add_files(), remove_item() and clear(), which
+    report just the inserted or removed rows to the view.
+    """
     
-    def __init__(self, index: int, item: BatchItem, parent=None):
+    def __init__(self, processor: BatchProcessor, parent=None):
         super().__init__(parent)
-        self.index = index
-        self.item = item
-        self._setup_ui()
-        self.update_display()
+        self.processor = processor
+        # Rows the view knows about; only changes inside begin/end calls
+        self._rows = processor.count
+        # (status, progress) each row was last repainted with
+        self._shown: list[tuple | None] = [None] * self._rows
     
-    def _setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-        layout.setSpacing(8)
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._rows:
+            return None
         
-        # Status icon
-        self.status_label = QLabel()
-        self.status_label.setFixedWidth(20)
-        layout.addWidget(self.status_label)
+        item = self.processor[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.filename
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return item.error or item.message or item.filepath
+        if role == Qt.ItemDataRole.UserRole:
+            return item
+        return None
+    
+    def item_changed(self, row: int):
+        """
+        Repaint one row after its item's status or progress changed.
+        Updates that only change the message (tooltip) are skipped.
+        """
+        if not 0 <= row < self._rows:
+            return
+        item = self.processor[row]
+        state = (item.status, item.progress)
+        if state != self._shown[row]:
+            self._shown[row] = state
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    def all_changed(self):
+        """Repaint every row (e.g. after a batch run ends)."""
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(self._rows - 1))
+    
+    def add_files(self, filepaths: list[str]) -> int:
+        """Queue files on the processor and append their rows."""
+        first = self._rows
+        added = self.processor.add_files(filepaths)
+        if added:
+            # The processor appends, so the new items are the last rows
+            self.beginInsertRows(QModelIndex(), first, first + added - 1)
+            self._rows += added
+            self._shown.extend([None] * added)
+            self.endInsertRows()
+        return added
+    
+    def remove_item(self, row: int) -> bool:
+        """Remove one item (not while a batch is running) and its row."""
+        if not 0 <= row < self._rows:
+            return False
+        if self.processor.is_processing:
+            return False
         
-        # Filename
-        self.name_label = QLabel()
-        self.name_label.setStyleSheet("font-size: 11px;")
-        layout.addWidget(self.name_label, stretch=1)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.processor.remove_item(row)
+        self._rows -= 1
+        del self._shown[row]
+        self.endRemoveRows()
+        return True
+    
+    def clear(self):
+        """Clear the processor's queue."""
+        self.beginResetModel()
+        self.processor.clear()
+        self._rows = self.processor.count
+        self._shown = [None] * self._rows
+        self.endResetModel()
+
+
+# ============================================================================
+# BATCH ITEM DELEGATE
+# ============================================================================
+
+class BatchItemDelegate(QStyledItemDelegate):
+    """
+    Paints a queue row: status icon, filename, progress bar and remove '×'.
+    
+    Rows are painted directly instead of hosting a widget each, so a long
+    queue costs one paint per visible row.
+    """
+    
+    @staticmethod
+    def remove_rect(rect: QRect) -> QRect:
+        """Get the hit area of a row's remove '×'."""
+        return QRect(rect.right() - 27, rect.top() + (rect.height() - 20) // 2, 20, 20)
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), ROW_HEIGHT)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        item = index.data(Qt.ItemDataRole.UserRole)
+        if item is None:
+            return
         
-        # Progress bar (only visible during processing)
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setFixedWidth(80)
-        self.progress_bar.setFixedHeight(8)
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { 
-                border: none; 
-                border-radius: 4px; 
-                background-color: #2a2a2a; 
-            }
-            QProgressBar::chunk { 
-                background-color: #6366f1; 
-                border-radius: 4px; 
-            }
-        """)
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
+        rect = option.rect
+        icon, name_color = STATUS_STYLES.get(item.status, _UNKNOWN_STATUS_STYLE)
+        processing = item.status == BatchStatus.PROCESSING
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setBrush(QColor("#2a2a2a"))
+            painter.drawRoundedRect(rect, 4, 4)
+        
+        font = QFont(option.font)
+        font.setPixelSize(11)
+        painter.setFont(font)
         
-        # Remove button
-        self.remove_btn = QPushButton("×")
-        self.remove_btn.setFixedSize(20, 20)
-        self.remove_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                color: #888;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                color: #ef4444;
-            }
-        """)
-        self.remove_btn.clicked.connect(lambda: self.remove_requested.emit(self.index))
-        layout.addWidget(self.remove_btn)
-    
-    def update_display(self):
-        """Update the display based on current item state."""
         # Status icon
-        icon = STATUS_ICONS.get(self.item.status, "?")
-        self.status_label.setText(icon)
+        left = rect.left() + 8
+        painter.setPen(QColor("#e0e0e0"))
+        painter.drawText(
+            QRect(left, rect.top(), 20, rect.height()),
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+            icon
+        )
+        left += 28
+        
+        remove = self.remove_rect(rect)
+        right = remove.left() - 8
+        
+        # Progress bar (only while processing)
+        if processing:
+            bar = QRect(right - 80, rect.center().y() - 4, 80, 8)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#2a2a2a"))
+            painter.drawRoundedRect(bar, 4, 4)
+            filled = bar.width() * max(0, min(item.progress, 100)) // 100
+            if filled > 0:
+                painter.setBrush(QColor("#6366f1"))
+                painter.drawRoundedRect(QRect(bar.left(), bar.top(), filled, bar.height()), 4, 4)
+            right = bar.left() - 8
+        
+        # Filename, colored by status
+        name_rect = QRect(left, rect.top(), max(0, right - left), rect.height())
+        painter.setPen(name_color)
+        painter.drawText(
+            name_rect,
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+            painter.fontMetrics().elidedText(
+                item.filename, Qt.TextElideMode.ElideMiddle, name_rect.width()
+            )
+        )
         
-        # Filename with color
-        color = STATUS_COLORS.get(self.item.status, "#888")
-        self.name_label.setText(self.item.filename)
-        self.name_label.setStyleSheet(f"color: {color}; font-size: 11px;")
+        # Remove '×' (the queue can't change while a batch is running)
+        if not index.model().processor.is_processing:
+            font.setPixelSize(14)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(QColor("#ef4444" if hovered else "#888"))
+            painter.drawText(remove, Qt.AlignmentFlag.AlignCenter, "×")
         
-        # Progress bar
-        if self.item.status == BatchStatus.PROCESSING:
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(self.item.progress)
-            self.remove_btn.setEnabled(False)
-        else:
-            self.progress_bar.setVisible(False)
-            self.remove_btn.setEnabled(True)
+        painter.restore()
 
 
 # ============================================================================
@@ -138,6 +245,14 @@ class BatchPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.processor = BatchProcessor()
+        
+        # Rows waiting for a repaint, flushed by one timer tick
+        self._dirty_rows: set[int] = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(REPAINT_INTERVAL_MS)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_dirty_rows)
+        
         self._setup_ui()
         self._connect_signals()
     
@@ -189,26 +304,26 @@ class BatchPanel(QWidget):
         
         layout.addLayout(header_layout)
         
-        # File list
-        self.file_list = QListWidget()
+        # File list (rows painted by BatchItemDelegate)
+        self.list_model = BatchListModel(self.processor, self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.list_model)
+        self.file_list.setItemDelegate(BatchItemDelegate(self.file_list))
+        self.file_list.setUniformItemSizes(True)
+        # Lay out long queues in chunks between events, not all at once
+        self.file_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.file_list.setBatchSize(LAYOUT_BATCH_SIZE)
+        self.file_list.setMouseTracking(True)  # Hover color of the '×'
         self.file_list.setMaximumHeight(150)
         self.file_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #1e1e1e;
                 border: 1px solid #3a3a3a;
                 border-radius: 6px;
                 padding: 4px;
             }
-            QListWidget::item {
-                background: transparent;
-                border-radius: 4px;
-                padding: 2px;
-            }
-            QListWidget::item:selected {
-                background-color: #2a2a2a;
-            }
         """)
-        self.file_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.file_list.clicked.connect(self._on_list_clicked)
         layout.addWidget(self.file_list)
         
         # Action buttons
@@ -281,39 +396,35 @@ class BatchPanel(QWidget):
             "Media Files (*.mp3 *.mp4 *.m4a *.wav *.ogg *.flac *.mkv *.avi *.mov *.webm);;All Files (*)"
         )
         
-        for path in filepaths:
-            self.processor.add_file(path)
-        
-        self._refresh_list()
+        self.list_model.add_files(filepaths)
+        self._update_header_state()
     
-    def _refresh_list(self):
-        """Refresh the file list display."""
-        self.file_list.clear()
-        
-        for i, item in enumerate(self.processor.items):
-            widget = BatchItemWidget(i, item)
-            widget.remove_requested.connect(self._remove_item)
-            
-            list_item = QListWidgetItem(self.file_list)
-            list_item.setSizeHint(widget.sizeHint())
-            self.file_list.addItem(list_item)
-            self.file_list.setItemWidget(list_item, widget)
-        
+    def _update_header_state(self):
+        """Update the item count and button states."""
         # Update counts and buttons
         count = self.processor.count
         self.count_label.setText(f"({count})")
         self.start_btn.setEnabled(count > 0 and not self.processor.is_processing)
         self.clear_btn.setEnabled(count > 0 and not self.processor.is_processing)
     
+    def _on_list_clicked(self, index: QModelIndex):
+        """Remove the clicked item if the click hit its '×'."""
+        pos = self.file_list.viewport().mapFromGlobal(QCursor.pos())
+        rect = self.file_list.visualRect(index)
+        if not BatchItemDelegate.remove_rect(rect).contains(pos):
+            return
+        self._remove_item(index.row())
+    
     def _remove_item(self, index: int):
         """Remove an item from the queue."""
-        self.processor.remove_item(index)
-        self._refresh_list()
+        if self.list_model.remove_item(index):
+            self._update_header_state()
     
     def _clear_queue(self):
         """Clear all items from the queue."""
-        self.processor.clear()
-        self._refresh_list()
+        self._dirty_rows.clear()
+        self.list_model.clear()
+        self._update_header_state()
     
     def _start_batch(self):
         """Emit signal to start batch processing."""
@@ -329,7 +440,8 @@ class BatchPanel(QWidget):
         translate: bool = False,
         n_threads: int = 4,
         enable_diarization: bool = False,
-        num_speakers: int = None
+        num_speakers: int = None,
+        gpu: tuple = None
     ):
         """Start the batch processing with given settings."""
         self.processor.start(
@@ -338,8 +450,11 @@ class BatchPanel(QWidget):
             translate=translate,
             n_threads=n_threads,
             enable_diarization=enable_diarization,
-            num_speakers=num_speakers
+            num_speakers=num_speakers,
+            gpu=gpu
         )
+        # Hide every row's '×' for the length of the batch
+        self.list_model.all_changed()
     
     def cancel_processing(self):
         """Cancel the current batch processing."""
@@ -347,37 +462,41 @@ class BatchPanel(QWidget):
     
     def _on_item_started(self, index: int):
         """Handle item started."""
-        self._update_item_widget(index)
+        self._mark_dirty(index)
     
     def _on_item_progress(self, index: int, progress: int, message: str):
         """Handle item progress update."""
-        self._update_item_widget(index)
+        self._mark_dirty(index)
     
     def _on_item_finished(self, index: int, result):
         """Handle item completion."""
-        self._update_item_widget(index)
+        self._mark_dirty(index)
     
     def _on_item_error(self, index: int, error: str):
         """Handle item error."""
-        self._update_item_widget(index)
+        self._mark_dirty(index)
+    
+    def _mark_dirty(self, index: int):
+        """Schedule a row repaint, merged with others in the same tick."""
+        self._dirty_rows.add(index)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_dirty_rows(self):
+        """Repaint every row changed since the last tick."""
+        rows, self._dirty_rows = self._dirty_rows, set()
+        for row in rows:
+            self.list_model.item_changed(row)
     
     def _on_batch_finished(self):
         """Handle batch completion."""
-        self.start_btn.setEnabled(self.processor.count > 0)
-        self.clear_btn.setEnabled(self.processor.count > 0)
         self.add_btn.setEnabled(True)
-        self._refresh_list()
-    
-    def _update_item_widget(self, index: int):
-        """Update a specific item widget."""
-        if index < 0 or index >= self.file_list.count():
-            return
+        self._update_header_state()
         
-        list_item = self.file_list.item(index)
-        widget = self.file_list.itemWidget(list_item)
-        if isinstance(widget, BatchItemWidget):
-            widget.item = self.processor.items[index]
-            widget.update_display()
+        # One repaint of every row covers any updates still pending
+        self._flush_timer.stop()
+        self._dirty_rows.clear()
+        self.list_model.all_changed()
     
     def get_results(self):
         """Get all completed results."""
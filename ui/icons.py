@@ -3,7 +3,7 @@ Whisper Fedora UI - SVG Vector Icons
 Centralized icon provider using inline SVG definitions for resolution-independent graphics.
 """
 
-from PyQt6.QtGui import QIcon, QPixmap, QPainter
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtCore import QByteArray, Qt, QSize
 from PyQt6.QtWidgets import QLabel
@@ -152,6 +152,15 @@ ICONS = {
 }
 
 
+# One parsed renderer per icon, drawn in white and tinted when painted.
+# All icons are single-color (currentColor), so tinting is exact.
+_ICON_RENDERERS: dict[str, QSvgRenderer] = {}
+
+# Rendered pixmaps and icons by (name, color, size); never change once drawn
+_PIXMAP_CACHE: dict[tuple[str, str, int], QPixmap] = {}
+_ICON_CACHE: dict[tuple[str, str, int], QIcon] = {}
+
+
 def get_icon(name: str, color: str = '#888888', size: int = 24) -> QIcon:
     """
     Generate a QIcon from SVG with specified color and size.
@@ -164,34 +173,24 @@ def get_icon(name: str, color: str = '#888888', size: int = 24) -> QIcon:
     Returns:
         QIcon object ready to use
     """
-    svg_data = ICONS.get(name, '')
-    if not svg_data:
-        return QIcon()
-    
-    # Replace currentColor with the specified color
-    svg_data = svg_data.replace('currentColor', color)
-    
-    # Create renderer from SVG data
-    renderer = QSvgRenderer(QByteArray(svg_data.encode()))
-    
-    # Create transparent pixmap
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.GlobalColor.transparent)
-    
-    # Render SVG to pixmap
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-    renderer.render(painter)
-    painter.end()
-    
-    return QIcon(pixmap)
+    key = (name, color, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        pixmap = get_pixmap(name, color, size)
+        if pixmap.isNull():
+            return QIcon()
+        icon = QIcon(pixmap)
+        _ICON_CACHE[key] = icon
+    return icon
 
 
 def get_pixmap(name: str, color: str = '#888888', size: int = 24) -> QPixmap:
     """
     Generate a QPixmap from SVG with specified color and size.
     
+    Each (name, color, size) is rendered once; later calls return the
+    cached pixmap (QPixmap is implicitly shared, so this is cheap).
+    
     Args:
         name: Icon name from ICONS dictionary
         color: Hex color string (e.g., '#ffffff')
@@ -200,27 +199,35 @@ def get_pixmap(name: str, color: str = '#888888', size: int = 24) -> QPixmap:
     Returns:
         QPixmap object ready to use
     """
-    svg_data = ICONS.get(name, '')
-    if not svg_data:
-        return QPixmap()
-    
-    # Replace currentColor with the specified color
-    svg_data = svg_data.replace('currentColor', color)
-    
-    # Create renderer from SVG data
-    renderer = QSvgRenderer(QByteArray(svg_data.encode()))
+    key = (name, color, size)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is not None:
+        return pixmap
+    
+    renderer = _ICON_RENDERERS.get(name)
+    if renderer is None:
+        svg_data = ICONS.get(name, '')
+        if not svg_data:
+            return QPixmap()
+        # Parse the SVG once, in white (currentColor replaced)
+        renderer = QSvgRenderer(QByteArray(svg_data.replace('currentColor', '#ffffff').encode()))
+        _ICON_RENDERERS[name] = renderer
     
     # Create transparent pixmap
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
     
-    # Render SVG to pixmap
+    # Render SVG to pixmap, then tint: SourceIn keeps the icon's alpha
+    # and takes the color from the fill
     painter = QPainter(pixmap)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
     painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
     renderer.render(painter)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    painter.fillRect(pixmap.rect(), QColor(color))
     painter.end()
     
+    _PIXMAP_CACHE[key] = pixmap
     return pixmap
 
 
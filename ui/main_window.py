@@ -19,10 +19,80 @@ from ui.batch_panel import BatchPanel
 from ui.icons import IconLabel, get_icon, IconColors
 from transcriber import Transcriber, TranscriptionResult
 from exporters import export_result, EXPORT_FORMATS
-from utils import WHISPER_MODELS, WHISPER_LANGUAGES, PERFORMANCE_MODES, detect_gpu, get_thread_count
+from utils import (
+    WHISPER_MODELS, WHISPER_LANGUAGES, PERFORMANCE_MODES, CPU_ISAS,
+    detect_gpu, get_thread_count
+)
 from config import get_config
 
 
+# ============================================================================
+# STYLES
+# ============================================================================
+
+# Header combo boxes; set once on the header bar and inherited by each combo
+HEADER_COMBO_STYLE = """
+    QComboBox {
+        padding: 6px 10px;
+        padding-right: 25px;
+        border: 1px solid #3a3a3a;
+        border-radius: 6px;
+        background-color: #2a2a2a;
+        color: #e0e0e0;
+        font-size: 12px;
+    }
+    QComboBox:hover {
+        border-color: #5a5a5a;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: center right;
+        width: 18px;
+        border: none;
+        background: transparent;
+    }
+    QComboBox::down-arrow {
+        width: 0;
+        height: 0;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 4px solid #888;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #2a2a2a;
+        border: 1px solid #3a3a3a;
+        selection-background-color: #6366f1;
+        color: #e0e0e0;
+        outline: none;
+    }
+"""
+
+
+def _badge_style(rgb: str, color: str) -> str:
+    """Stylesheet for a rounded, translucent badge button."""
+    return f"""
+    QPushButton {{
+        background-color: rgba({rgb}, 0.2);
+        border: none;
+        border-radius: 12px;
+        padding: 4px 12px;
+        color: {color};
+        font-size: 11px;
+    }}
+    QPushButton:hover {{
+        background-color: rgba({rgb}, 0.3);
+    }}
+"""
+
+
+# Device button styles: CUDA/ROCm GPU, Apple Metal, and CPU
+DEVICE_BADGE_STYLES = {
+    'gpu': _badge_style('34, 197, 94', '#22c55e'),
+    'metal': _badge_style('99, 102, 241', '#6366f1'),
+    'cpu': _badge_style('136, 136, 136', '#888'),
+}
+
+
 # ============================================================================
 # BACKGROUND WORKER FOR AI PROCESSING
 # ============================================================================
@@ -100,6 +170,24 @@ class AIProcessingWorker(QThread):
             self.finished.emit(result)
 
 
+class QuantizeWorker(QThread):
+    """Background worker converting a model with whisper.cpp's quantize tool."""
+    
+    finished = pyqtSignal(str)  # path of the quantized model
+    error = pyqtSignal(str)     # error message
+    
+    def __init__(self, transcriber: Transcriber, model_name: str):
+        super().__init__()
+        self.transcriber = transcriber
+        self.model_name = model_name
+    
+    def run(self):
+        try:
+            self.finished.emit(self.transcriber.quantize_model(self.model_name))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
 # ============================================================================
 # MAIN WINDOW
 # ============================================================================
@@ -113,23 +201,28 @@ class MainWindow(QMainWindow):
         self._current_result: TranscriptionResult | None = None
         self._cleaned_text: str | None = None
         self._ai_worker: AIProcessingWorker | None = None
+        self._quantize_worker: QuantizeWorker | None = None
         # Device toggle: True = use GPU (if available), False = force CPU
         self._use_gpu = True
         self._gpu_type, self._gpu_name = self.transcriber.gpu_type, self.transcriber.gpu_name
         self._setup_ui()
         self._connect_signals()
+        self._check_cpu_build()
     
     def closeEvent(self, event):
         """Handle window close - cleanup resources."""
-        # Stop any running transcription
-        if self.transcriber.is_busy():
-            self.transcriber.cancel()
+        # Stop any running transcription and its worker thread
+        self.transcriber.shutdown()
         
         # Stop AI worker if running
         if self._ai_worker and self._ai_worker.isRunning():
             self._ai_worker.cancel()
             self._ai_worker.wait()
         
+        # Let a model conversion finish writing its file
+        if self._quantize_worker and self._quantize_worker.isRunning():
+            self._quantize_worker.wait()
+        
         # Cleanup AI panel timers
         if hasattr(self, 'ai_panel'):
             self.ai_panel.cleanup()
@@ -145,41 +238,6 @@ class MainWindow(QMainWindow):
         """Create a compact combo box for the header bar."""
         combo = QComboBox()
         combo.setFixedWidth(width)
-        combo.setStyleSheet("""
-            QComboBox {
-                padding: 6px 10px;
-                padding-right: 25px;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                font-size: 12px;
-            }
-            QComboBox:hover {
-                border-color: #5a5a5a;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 18px;
-                border: none;
-                background: transparent;
-            }
-            QComboBox::down-arrow {
-                width: 0;
-                height: 0;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #888;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                selection-background-color: #6366f1;
-                color: #e0e0e0;
-                outline: none;
-            }
-        """)
         for item in items:
             if isinstance(item, tuple):
                 combo.addItem(item[1], item[0])
@@ -202,6 +260,7 @@ class MainWindow(QMainWindow):
         
         # ===== Header Bar with Settings =====
         header = QWidget()
+        header.setStyleSheet(HEADER_COMBO_STYLE)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(16)
@@ -225,6 +284,32 @@ class MainWindow(QMainWindow):
         self.model_combo.setCurrentIndex(1)  # Default to 'base'
         header_layout.addWidget(self.model_combo)
         
+        # One-time conversion of the selected model to a quantized file
+        quant = get_config().model_quant.upper()
+        self.quantize_btn = QPushButton(f"⚡ {quant}")
+        self.quantize_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.quantize_btn.setToolTip(
+            f"Convert the selected model to {quant}\n\n"
+            "Smaller weights, faster transcription at nearly the same accuracy"
+        )
+        self.quantize_btn.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(136, 136, 136, 0.2);
+                border: none;
+                border-radius: 12px;
+                padding: 4px 10px;
+                color: #888;
+                font-size: 11px;
+            }
+            QPushButton:hover {
+                background-color: rgba(136, 136, 136, 0.3);
+            }
+        """)
+        self.quantize_btn.clicked.connect(self._start_quantization)
+        self.model_combo.currentIndexChanged.connect(self._update_quantize_button)
+        self._update_quantize_button()
+        header_layout.addWidget(self.quantize_btn)
+        
         header_layout.addSpacing(8)
         
         # Language selector
@@ -251,7 +336,11 @@ class MainWindow(QMainWindow):
         self.perf_combo = self._create_header_combo(
             [(mode[0], mode[1]) for mode in PERFORMANCE_MODES], 145
         )
-        self.perf_combo.setCurrentIndex(1)  # Default to 'Balanced'
+        # Default to 'Performance': transcription is CPU-bound, so all
+        # cores pay off; the lower modes keep the machine responsive
+        self.perf_combo.setCurrentIndex(
+            [mode[0] for mode in PERFORMANCE_MODES].index('performance')
+        )
         self.perf_combo.setToolTip("Energy vs Speed tradeoff\n\n"
             "🔋 Efficiency: Low CPU, saves battery\n"
             "⚡ Balanced: Moderate CPU usage\n"
@@ -476,50 +565,61 @@ class MainWindow(QMainWindow):
         """Update the device button appearance based on current selection."""
         if self._use_gpu and self._gpu_type in ('cuda', 'rocm'):
             self.device_btn.setText(f"🚀 {self._gpu_name}")
-            self.device_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(34, 197, 94, 0.2);
-                    border: none;
-                    border-radius: 12px;
-                    padding: 4px 12px;
-                    color: #22c55e;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(34, 197, 94, 0.3);
-                }
-            """)
+            self.device_btn.setStyleSheet(DEVICE_BADGE_STYLES['gpu'])
         elif self._use_gpu and self._gpu_type == 'metal':
             self.device_btn.setText(f"🍎 {self._gpu_name}")
-            self.device_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(99, 102, 241, 0.2);
-                    border: none;
-                    border-radius: 12px;
-                    padding: 4px 12px;
-                    color: #6366f1;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(99, 102, 241, 0.3);
-                }
-            """)
+            self.device_btn.setStyleSheet(DEVICE_BADGE_STYLES['metal'])
         else:
-            # CPU mode or no GPU
-            self.device_btn.setText("💻 CPU")
-            self.device_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(136, 136, 136, 0.2);
-                    border: none;
-                    border-radius: 12px;
-                    padding: 4px 12px;
-                    color: #888;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(136, 136, 136, 0.3);
-                }
-            """)
+            # CPU mode or no GPU; name the SIMD path whisper.cpp runs on
+            isa = self.transcriber.build_isa or self.transcriber.cpu_isa
+            self.device_btn.setText(f"💻 CPU · {isa.upper().replace('_', '-')}")
+            self.device_btn.setStyleSheet(DEVICE_BADGE_STYLES['cpu'])
+    
+    def _check_cpu_build(self):
+        """Warn when whisper.cpp was built without the CPU's best SIMD set."""
+        cpu_isa, build_isa = self.transcriber.cpu_isa, self.transcriber.build_isa
+        if build_isa is None or cpu_isa not in CPU_ISAS:
+            return
+        if build_isa not in CPU_ISAS or CPU_ISAS.index(build_isa) > CPU_ISAS.index(cpu_isa):
+            self.status_label.setText(
+                f"whisper.cpp build lacks {cpu_isa.upper()} - "
+                "reinstall pywhispercpp from source for faster CPU transcription"
+            )
+    
+    def _update_quantize_button(self):
+        """Show the convert button only when the selected model can be converted."""
+        converting = self._quantize_worker is not None and self._quantize_worker.isRunning()
+        self.quantize_btn.setVisible(
+            converting or self.transcriber.can_quantize(self.model_combo.currentData())
+        )
+    
+    def _start_quantization(self):
+        """Convert the selected model in the background."""
+        if self._quantize_worker and self._quantize_worker.isRunning():
+            return
+        
+        model = self.model_combo.currentData()
+        self.quantize_btn.setEnabled(False)
+        self.status_label.setText(f"Converting {model} model...")
+        
+        self._quantize_worker = QuantizeWorker(self.transcriber, model)
+        self._quantize_worker.finished.connect(self._on_quantize_finished)
+        self._quantize_worker.error.connect(self._on_quantize_error)
+        self._quantize_worker.start()
+    
+    def _on_quantize_finished(self, path: str):
+        """Handle model conversion completion."""
+        self._quantize_worker = None
+        self.quantize_btn.setEnabled(True)
+        self._update_quantize_button()
+        self.status_label.setText(f"Converted: {os.path.basename(path)}")
+    
+    def _on_quantize_error(self, error_message: str):
+        """Handle model conversion failure."""
+        self._quantize_worker = None
+        self.quantize_btn.setEnabled(True)
+        self._update_quantize_button()
+        self.status_label.setText(f"Conversion failed: {error_message[:50]}")
     
     def _on_file_selected(self, filepath: str):
         """Handle file selection."""
@@ -569,7 +669,10 @@ class MainWindow(QMainWindow):
             num_speakers=None,  # Auto-detect
             on_progress=self._on_progress,
             on_finished=self._on_finished,
-            on_error=self._on_error
+            on_error=self._on_error,
+            use_gpu=self._use_gpu,
+            on_segment=self.transcript_view.append_segment,
+            on_segments_reset=self.transcript_view.clear
         )
     
     def _cancel_operation(self):
@@ -603,7 +706,8 @@ class MainWindow(QMainWindow):
             translate=translate,
             n_threads=n_threads,
             enable_diarization=enable_diarization,
-            num_speakers=None
+            num_speakers=None,
+            gpu=(self._gpu_type, self._gpu_name) if self._use_gpu else ('cpu', "CPU")
         )
     
     def _on_progress(self, percentage: int, message: str):
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCharFormat, QColor, QTextCursor
 
-from transcriber import TranscriptionResult
+from transcriber import Segment, TranscriptionResult
 from utils import format_timestamp_vtt
 from ui.icons import get_icon, IconColors
 
@@ -261,6 +261,27 @@ class TranscriptView(QWidget):
         html = '<br>'.join(html_lines)
         self.text_edit.setHtml(html)
     
+    def append_segment(self, segment: Segment):
+        """Show a segment while transcription is still running."""
+        if self._show_timestamps:
+            line = f"[{format_timestamp_vtt(segment.start)}]  {segment.text.strip()}"
+        else:
+            line = segment.text.strip()
+        
+        # Inserted as plain text: append() would render text that looks
+        # like markup ("<b>", "&amp;") as HTML
+        scrollbar = self.text_edit.verticalScrollBar()
+        following = scrollbar.value() == scrollbar.maximum()
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.text_edit.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(line)
+        
+        # Keep following the transcript, as append() did
+        if following:
+            scrollbar.setValue(scrollbar.maximum())
+    
     def set_result(self, result: TranscriptionResult):
         """Set the transcription result to display."""
         self._result = result
@@ -6,7 +6,14 @@ import os
 import platform
 import subprocess
 import shutil
-from typing import Optional, Tuple
+import time
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+try:
+    import cpuinfo
+except ImportError:  # Optional: /proc/cpuinfo is read instead on Linux
+    cpuinfo = None
 
 
 # Supported audio/video formats
@@ -40,22 +47,23 @@ def format_duration(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+def _format_timestamp(seconds: float, millis_sep: str) -> str:
+    """Format seconds as HH:MM:SS<sep>mmm using integer milliseconds."""
+    millis = round(seconds * 1000)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{millis_sep}{millis:03d}"
+
+
 def format_timestamp_srt(seconds: float) -> str:
     """Format seconds to SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return _format_timestamp(seconds, ',')
 
 
 def format_timestamp_vtt(seconds: float) -> str:
     """Format seconds to VTT timestamp format (HH:MM:SS.mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    return _format_timestamp(seconds, '.')
 
 
 def detect_gpu() -> Tuple[str, str]:
@@ -111,14 +119,69 @@ def detect_gpu() -> Tuple[str, str]:
     return ('cpu', "CPU (No GPU detected)")
 
 
+# SIMD instruction sets whisper.cpp has kernels for, best first
+CPU_ISAS = ('avx512_vnni', 'avx512', 'avx2', 'avx', 'neon')
+
+
+def _cpu_flags() -> set:
+    """Get the CPU feature flags (lowercase), or an empty set if unknown."""
+    if cpuinfo is not None:
+        try:
+            return {flag.lower() for flag in cpuinfo.get_cpu_info().get('flags', [])}
+        except Exception:
+            pass
+    
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                # x86 lists "flags", ARM lists "Features"
+                key, _, value = line.partition(':')
+                if key.strip() in ('flags', 'Features'):
+                    return set(value.split())
+    except OSError:
+        pass
+    return set()
+
+
+@lru_cache(maxsize=None)
+def detect_isa() -> str:
+    """
+    Detect the best SIMD instruction set of this CPU.
+    Returns one of CPU_ISAS, or 'generic' if none is available.
+    """
+    flags = _cpu_flags()
+    if 'avx512_vnni' in flags or 'avx512vnni' in flags:
+        return 'avx512_vnni'
+    if 'avx512f' in flags:
+        return 'avx512'
+    if 'avx2' in flags:
+        return 'avx2'
+    if 'avx' in flags:
+        return 'avx'
+    # NEON is mandatory on 64-bit ARM ("asimd" in /proc/cpuinfo)
+    if 'neon' in flags or 'asimd' in flags or platform.machine().lower() in ('arm64', 'aarch64'):
+        return 'neon'
+    return 'generic'
+
+
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    """
+    Locate a command on PATH, or None if it is not installed.
+    The PATH walk is done once per command for the life of the process.
+    """
+    return shutil.which(name)
+
+
 def get_audio_duration(filepath: str) -> Optional[float]:
     """Get the duration of an audio/video file using ffprobe."""
-    if not shutil.which('ffprobe'):
+    ffprobe = find_executable('ffprobe')
+    if ffprobe is None:
         return None
     
     try:
         result = subprocess.run([
-            'ffprobe', '-v', 'error',
+            ffprobe, '-v', 'error',
             '-show_entries', 'format=duration',
             '-of', 'default=noprint_wrappers=1:nokey=1',
             filepath
@@ -200,7 +263,48 @@ PERFORMANCE_MODES = [
 ]
 
 
-def get_thread_count(mode: str = 'balanced') -> int:
+# Minimum time between repeated progress updates sent to the UI (seconds)
+PROGRESS_MIN_INTERVAL = 0.1
+
+
+def throttle_progress(
+    callback: Callable[[int, str], None],
+    min_interval: float = PROGRESS_MIN_INTERVAL
+) -> Callable[[int, str], None]:
+    """
+    Wrap a progress callback so updates arriving too quickly are dropped.
+    
+    Per-segment updates can come much faster than the UI repaints, and each
+    one crossing threads is a queued signal. New messages and the final
+    100% are always delivered. The wrapper is meant for one thread.
+    """
+    last_time, last_message = 0.0, None
+    
+    def emit(percentage: int, message: str):
+        nonlocal last_time, last_message
+        now = time.monotonic()
+        if (message != last_message or percentage >= 100
+                or now - last_time >= min_interval):
+            last_time, last_message = now, message
+            callback(percentage, message)
+    
+    return emit
+
+
+def available_cpu_count() -> int:
+    """
+    Get the number of CPUs this process may run on.
+    
+    Honors CPU affinity and cpusets (containers, taskset), which
+    os.cpu_count() ignores.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):  # Not available on macOS/Windows
+        return os.cpu_count() or 4
+
+
+def get_thread_count(mode: str = 'performance') -> int:
     """
     Get optimal thread count based on performance mode.
     
@@ -210,8 +314,7 @@ def get_thread_count(mode: str = 'balanced') -> int:
     Returns:
         Number of threads to use for transcription
     """
-    import os
-    cpu_count = os.cpu_count() or 4
+    cpu_count = available_cpu_count()
     
     # Find the mode's thread multiplier
     for mode_key, _, multiplier, _ in PERFORMANCE_MODES:
@@ -220,5 +323,5 @@ def get_thread_count(mode: str = 'balanced') -> int:
             threads = max(1, int(cpu_count * multiplier))
             return min(threads, cpu_count)
     
-    # Default to balanced if mode not found
-    return max(2, cpu_count // 2)
+    # Default to all cores if mode not found
+    return cpu_count
@@ -250,7 +250,7 @@ def call_lm_studio(
         )
         
         with urllib.request.urlopen(req, timeout=300) as response:
-            result = json.loads(response.read().decode('utf-8'))
+            result = json.loads(response.read())
             return result['choices'][0]['message']['content']
             
     except urllib.error.URLError as e: